@@ -261,6 +261,9 @@ class FileProcessingConfig:
     MIN_RESUME_LENGTH = int(os.getenv("MIN_RESUME_LENGTH", 100))
     PARSING_TIMEOUT = int(os.getenv("PARSING_TIMEOUT", 30))
     TEXT_CLEANING_ENABLED = os.getenv("TEXT_CLEANING_ENABLED", "True").lower() == "true"
+    # "auto" / "pypdf2" use PyPDF2; "pdfplumber-rs" / "pypdfium2" are opt-in
+    # and require that package
+    PDF_BACKEND = os.getenv("PDF_BACKEND", "auto").lower()
 
 # ============================================
 # PERFORMANCE OPTIMIZATION
@@ -35,11 +35,16 @@ Version: 3.0
 Date: 2026-01-18
 """
 
+import dataclasses
 import logging
-from typing import Dict, Any, Optional
+import numbers
+from bisect import bisect_right
+from typing import Dict, Any, List, Optional, Sequence, Union
 from pathlib import Path
 import sys
 
+import numpy as np
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -48,6 +53,85 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(slots=True)
+class Contribution:
+    """Score contributed by one source (resume or heuristic)"""
+    score: float
+    max: int
+    percentage: float
+    
+    def __post_init__(self):
+        # Keep plain Python floats even when scores arrive as NumPy scalars
+        self.score = float(self.score)
+        self.percentage = float(self.percentage)
+    
+    def __getitem__(self, key: str):
+        """Dict-style read access, e.g. contribution['score']"""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a plain dict copy (for JSON serialization)"""
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass(slots=True)
+class FinalScoreResult:
+    """
+    Result of FinalScorer.calculate_final_score
+    
+    Supports dict-style access (result['final_trust_score'], 'key' in result,
+    result['interpretation'] = ...) so callers written against the old dict
+    result keep working. Optional fields are None until a helper such as
+    calculate_with_interpretation fills them in, and count as absent for `in`.
+    """
+    final_trust_score: float
+    max_score: int
+    percentage: float
+    risk_level: str
+    recommendation: str
+    resume_contribution: Contribution
+    heuristic_contribution: Contribution
+    breakdown: Dict[str, Any]
+    validation: Dict[str, Any]
+    interpretation: Optional[str] = None
+    risk_description: Optional[str] = None
+    recommendation_description: Optional[str] = None
+    
+    def __post_init__(self):
+        # Keep plain Python floats even when scores arrive as NumPy scalars
+        self.final_trust_score = float(self.final_trust_score)
+        self.percentage = float(self.percentage)
+    
+    def __getitem__(self, key: str):
+        """Dict-style read access, e.g. result['final_trust_score']"""
+        value = getattr(self, key, None)
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key: str, value: Any):
+        """Dict-style assignment to an existing field"""
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __contains__(self, key: str) -> bool:
+        return getattr(self, key, None) is not None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style get with default"""
+        value = getattr(self, key, None)
+        return default if value is None else value
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a plain dict copy (for JSON serialization), omitting unset fields"""
+        return {key: value for key, value in dataclasses.asdict(self).items() if value is not None}
+
+
 class FinalScorer:
     """
     Calculates the final trust score by combining resume and heuristic scores.
@@ -85,8 +169,26 @@ class FinalScorer:
     LOW_RISK_THRESHOLD = 80
     MEDIUM_RISK_THRESHOLD = 55
     
+    # Score interpretation buckets: a score >= _INTERPRETATION_THRESHOLDS[i-1]
+    # (and below the next threshold) maps to _INTERPRETATION_LABELS[i]
+    _INTERPRETATION_THRESHOLDS = (40, 50, 60, 70, 80, 90)
+    _INTERPRETATION_LABELS = (
+        "Very Poor - Critical issues, not recommended",
+        "Poor - Low trustworthiness, major red flags",
+        "Fair - Below average trustworthiness, significant concerns",
+        "Acceptable - Moderate trustworthiness, some concerns",
+        "Good - Solid trustworthiness, suitable for most projects",
+        "Excellent - High trustworthiness with strong credentials",
+        "Exceptional - Outstanding trustworthiness across all metrics"
+    )
+    
     def __init__(self):
         """Initialize the Final Scorer"""
+        # Percentage scale factors, so percentages are a multiply, not a divide
+        self._pct_r = 100.0 / self.RESUME_MAX
+        self._pct_h = 100.0 / self.HEURISTIC_MAX
+        self._pct_f = 100.0 / self.FINAL_MAX
+        
         logger.info("Final Scorer initialized")
         logger.info(f"  Resume max: {self.RESUME_MAX}")
         logger.info(f"  Heuristic max: {self.HEURISTIC_MAX}")
@@ -99,7 +201,7 @@ class FinalScorer:
         heuristic_score: float,
         resume_breakdown: Optional[Dict[str, float]] = None,
         heuristic_breakdown: Optional[Dict[str, float]] = None
-    ) -> Dict[str, Any]:
+    ) -> FinalScoreResult:
         """
         Calculate final trust score by combining resume and heuristic scores.
         
@@ -110,7 +212,7 @@ class FinalScorer:
             heuristic_breakdown: Optional breakdown of heuristic score components
         
         Returns:
-            Dictionary containing:
+            FinalScoreResult containing:
             - final_trust_score: Combined score (0-100)
             - max_score: Maximum possible score (100)
             - percentage: Score as percentage
@@ -147,9 +249,9 @@ class FinalScorer:
         
         # Step 3: Calculate percentages
         logger.info("\n📋 Step 3: Calculating Percentages...")
-        percentage = (final_trust_score / self.FINAL_MAX) * 100
-        resume_percentage = (resume_score / self.RESUME_MAX) * 100
-        heuristic_percentage = (heuristic_score / self.HEURISTIC_MAX) * 100
+        percentage = final_trust_score * self._pct_f
+        resume_percentage = resume_score * self._pct_r
+        heuristic_percentage = heuristic_score * self._pct_h
         
         logger.info(f"  Overall: {percentage:.1f}%")
         logger.info(f"  Resume: {resume_percentage:.1f}%")
@@ -173,25 +275,25 @@ class FinalScorer:
         logger.info(f"  Recommendation: {recommendation}")
         
         # Step 6: Prepare result
-        result = {
-            'final_trust_score': round(final_trust_score, 2),
-            'max_score': self.FINAL_MAX,
-            'percentage': round(percentage, 2),
-            'risk_level': risk_level,
-            'recommendation': recommendation,
-            'resume_contribution': {
-                'score': round(resume_score, 2),
-                'max': self.RESUME_MAX,
-                'percentage': round(resume_percentage, 2)
-            },
-            'heuristic_contribution': {
-                'score': round(heuristic_score, 2),
-                'max': self.HEURISTIC_MAX,
-                'percentage': round(heuristic_percentage, 2)
-            },
-            'breakdown': breakdown,
-            'validation': validation_result
-        }
+        result = FinalScoreResult(
+            final_trust_score=round(final_trust_score, 2),
+            max_score=self.FINAL_MAX,
+            percentage=round(percentage, 2),
+            risk_level=risk_level,
+            recommendation=recommendation,
+            resume_contribution=Contribution(
+                score=round(resume_score, 2),
+                max=self.RESUME_MAX,
+                percentage=round(resume_percentage, 2)
+            ),
+            heuristic_contribution=Contribution(
+                score=round(heuristic_score, 2),
+                max=self.HEURISTIC_MAX,
+                percentage=round(heuristic_percentage, 2)
+            ),
+            breakdown=breakdown,
+            validation=validation_result
+        )
         
         # Print summary
         logger.info("\n" + "="*70)
@@ -207,6 +309,112 @@ class FinalScorer:
         
         return result
     
+    def calculate_final_scores_batch(
+        self,
+        resume_scores: Union[Sequence[float], np.ndarray],
+        heuristic_scores: Union[Sequence[float], np.ndarray],
+        return_dicts: bool = False
+    ) -> Union[Dict[str, np.ndarray], List[Dict[str, Any]]]:
+        """
+        Calculate final trust scores for many candidates at once.
+        
+        Vectorized counterpart of calculate_final_score for bulk scoring:
+        validation, sums, percentages and risk levels are computed with
+        NumPy array operations instead of a Python loop.
+        
+        Args:
+            resume_scores: Resume scores (0-70), one per candidate
+            heuristic_scores: Heuristic scores (0-30), one per candidate
+            return_dicts: If True, return one result dict per candidate
+                (same shape as calculate_final_score, minus 'validation');
+                otherwise return a dict of parallel arrays
+        
+        Returns:
+            Dictionary of arrays (all rounded to 2 decimals):
+            - final_trust_score, percentage
+            - resume_percentage, heuristic_percentage
+            - risk_level, recommendation
+            or a list of per-candidate result dicts if return_dicts is True
+        
+        Raises:
+            ValueError: If inputs are non-numeric, mismatched in length,
+                or any score is out of valid range
+        """
+        try:
+            resume = np.asarray(resume_scores, dtype=np.float64)
+            heuristic = np.asarray(heuristic_scores, dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Score validation failed: scores must be numeric ({e})")
+        
+        if resume.ndim != 1 or resume.shape != heuristic.shape:
+            raise ValueError(
+                f"Score validation failed: expected two 1-D arrays of equal length, "
+                f"got shapes {resume.shape} and {heuristic.shape}"
+            )
+        
+        # NaN compares False on both sides, so it is rejected here as well
+        resume_ok = (resume >= 0) & (resume <= self.RESUME_MAX)
+        heuristic_ok = (heuristic >= 0) & (heuristic <= self.HEURISTIC_MAX)
+        if not (resume_ok & heuristic_ok).all():
+            errors = []
+            if not resume_ok.all():
+                errors.append(f"Resume scores out of range (0-{self.RESUME_MAX}) at indices {np.flatnonzero(~resume_ok).tolist()}")
+            if not heuristic_ok.all():
+                errors.append(f"Heuristic scores out of range (0-{self.HEURISTIC_MAX}) at indices {np.flatnonzero(~heuristic_ok).tolist()}")
+            error_msg = f"Score validation failed: {errors}"
+            logger.error(f"❌ {error_msg}")
+            raise ValueError(error_msg)
+        
+        final = resume + heuristic
+        percentage = final * self._pct_f
+        resume_percentage = resume * self._pct_r
+        heuristic_percentage = heuristic * self._pct_h
+        
+        risk_level = np.where(
+            final >= self.LOW_RISK_THRESHOLD, "LOW",
+            np.where(final >= self.MEDIUM_RISK_THRESHOLD, "MEDIUM", "HIGH")
+        )
+        recommendation = np.where(
+            risk_level == "LOW", "TRUSTWORTHY",
+            np.where(risk_level == "MEDIUM", "MODERATE", "RISKY")
+        )
+        
+        logger.info(f"✓ Batch final scores calculated for {final.size} candidates")
+        
+        arrays = {
+            'final_trust_score': np.round(final, 2),
+            'percentage': np.round(percentage, 2),
+            'resume_percentage': np.round(resume_percentage, 2),
+            'heuristic_percentage': np.round(heuristic_percentage, 2),
+            'risk_level': risk_level,
+            'recommendation': recommendation
+        }
+        
+        if not return_dicts:
+            return arrays
+        
+        return [
+            {
+                'final_trust_score': float(arrays['final_trust_score'][i]),
+                'max_score': self.FINAL_MAX,
+                'percentage': float(arrays['percentage'][i]),
+                'risk_level': str(risk_level[i]),
+                'recommendation': str(recommendation[i]),
+                'resume_contribution': {
+                    'score': round(float(resume[i]), 2),
+                    'max': self.RESUME_MAX,
+                    'percentage': float(arrays['resume_percentage'][i])
+                },
+                'heuristic_contribution': {
+                    'score': round(float(heuristic[i]), 2),
+                    'max': self.HEURISTIC_MAX,
+                    'percentage': float(arrays['heuristic_percentage'][i])
+                },
+                'breakdown': self._build_breakdown(float(resume[i]), float(heuristic[i]), None, None)
+            }
+            for i in range(final.size)
+        ]
+    
     def _validate_scores(
         self,
         resume_score: float,
@@ -225,36 +433,34 @@ class FinalScorer:
         errors = []
         warnings = []
         
-        # Validate resume score
-        if not isinstance(resume_score, (int, float)):
-            errors.append(f"Resume score must be numeric, got {type(resume_score)}")
-        elif resume_score < 0:
-            errors.append(f"Resume score cannot be negative: {resume_score}")
-        elif resume_score > self.RESUME_MAX:
-            errors.append(f"Resume score exceeds maximum ({self.RESUME_MAX}): {resume_score}")
-        
-        # Validate heuristic score
-        if not isinstance(heuristic_score, (int, float)):
-            errors.append(f"Heuristic score must be numeric, got {type(heuristic_score)}")
-        elif heuristic_score < 0:
-            errors.append(f"Heuristic score cannot be negative: {heuristic_score}")
-        elif heuristic_score > self.HEURISTIC_MAX:
-            errors.append(f"Heuristic score exceeds maximum ({self.HEURISTIC_MAX}): {heuristic_score}")
-        
-        # Check for warnings (unusual but valid scores)
-        if resume_score < 10:
-            warnings.append(f"Very low resume score: {resume_score}")
-        if heuristic_score < 5:
-            warnings.append(f"Very low heuristic score: {heuristic_score}")
-        
-        valid = len(errors) == 0
+        # Fast path: one comparison chain per score. Non-numeric input makes
+        # the chain raise TypeError; NaN compares False on both bounds.
+        try:
+            resume_valid = 0.0 <= resume_score <= self.RESUME_MAX
+            heuristic_valid = 0.0 <= heuristic_score <= self.HEURISTIC_MAX
+        except TypeError:
+            resume_valid = heuristic_valid = False
+        
+        if resume_valid and heuristic_valid:
+            # Check for warnings (unusual but valid scores)
+            if resume_score < 10:
+                warnings.append(f"Very low resume score: {resume_score}")
+            if heuristic_score < 5:
+                warnings.append(f"Very low heuristic score: {heuristic_score}")
+        else:
+            # Slow path: work out which bound was violated for the error message
+            resume_error = self._describe_score_error("Resume", resume_score, self.RESUME_MAX)
+            heuristic_error = self._describe_score_error("Heuristic", heuristic_score, self.HEURISTIC_MAX)
+            resume_valid = resume_error is None
+            heuristic_valid = heuristic_error is None
+            errors = [error for error in (resume_error, heuristic_error) if error]
         
         result = {
-            'valid': valid,
+            'valid': len(errors) == 0,
             'errors': errors,
             'warnings': warnings,
-            'resume_valid': 0 <= resume_score <= self.RESUME_MAX if isinstance(resume_score, (int, float)) else False,
-            'heuristic_valid': 0 <= heuristic_score <= self.HEURISTIC_MAX if isinstance(heuristic_score, (int, float)) else False
+            'resume_valid': resume_valid,
+            'heuristic_valid': heuristic_valid
         }
         
         if warnings:
@@ -263,6 +469,29 @@ class FinalScorer:
         
         return result
     
+    @staticmethod
+    def _describe_score_error(label: str, score: Any, max_score: int) -> Optional[str]:
+        """
+        Describe why a score failed validation.
+        
+        Args:
+            label: Score name used in the message ("Resume" or "Heuristic")
+            score: Score to check
+            max_score: Upper bound for the score
+        
+        Returns:
+            Error message, or None if the score is valid
+        """
+        if not isinstance(score, numbers.Real):
+            return f"{label} score must be numeric, got {type(score)}"
+        if score < 0:
+            return f"{label} score cannot be negative: {score}"
+        if score > max_score:
+            return f"{label} score exceeds maximum ({max_score}): {score}"
+        if score != score:
+            return f"{label} score must be a number, got NaN"
+        return None
+    
     def _build_breakdown(
         self,
         resume_score: float,
@@ -393,20 +622,27 @@ class FinalScorer:
         Returns:
             Interpretation string
         """
-        if final_score >= 90:
-            return "Exceptional - Outstanding trustworthiness across all metrics"
-        elif final_score >= 80:
-            return "Excellent - High trustworthiness with strong credentials"
-        elif final_score >= 70:
-            return "Good - Solid trustworthiness, suitable for most projects"
-        elif final_score >= 60:
-            return "Acceptable - Moderate trustworthiness, some concerns"
-        elif final_score >= 50:
-            return "Fair - Below average trustworthiness, significant concerns"
-        elif final_score >= 40:
-            return "Poor - Low trustworthiness, major red flags"
-        else:
-            return "Very Poor - Critical issues, not recommended"
+        return self._INTERPRETATION_LABELS[bisect_right(self._INTERPRETATION_THRESHOLDS, final_score)]
+    
+    def get_score_interpretations_batch(
+        self,
+        final_scores: Union[Sequence[float], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Get interpretations for many final scores with one searchsorted call.
+        
+        Args:
+            final_scores: Final trust scores (0-100)
+        
+        Returns:
+            Array of interpretation strings, one per score
+        """
+        buckets = np.searchsorted(
+            np.asarray(self._INTERPRETATION_THRESHOLDS, dtype=np.float64),
+            np.asarray(final_scores, dtype=np.float64),
+            side='right'
+        )
+        return np.asarray(self._INTERPRETATION_LABELS)[buckets]
     
     def calculate_with_interpretation(
         self,
@@ -414,7 +650,7 @@ class FinalScorer:
         heuristic_score: float,
         resume_breakdown: Optional[Dict[str, float]] = None,
         heuristic_breakdown: Optional[Dict[str, float]] = None
-    ) -> Dict[str, Any]:
+    ) -> FinalScoreResult:
         """
         Calculate final score with interpretation (Step 5.1 compatibility).
         
@@ -425,7 +661,7 @@ class FinalScorer:
             heuristic_breakdown: Optional heuristic component breakdown
         
         Returns:
-            Result dictionary with interpretation added
+            FinalScoreResult with interpretation added
         """
         result = self.calculate_final_score(
             resume_score,
@@ -434,9 +670,9 @@ class FinalScorer:
             heuristic_breakdown
         )
         
-        result['interpretation'] = self.get_score_interpretation(result['final_trust_score'])
+        result.interpretation = self.get_score_interpretation(result.final_trust_score)
         
-        logger.info(f"\n📊 Interpretation: {result['interpretation']}")
+        logger.info(f"\n📊 Interpretation: {result.interpretation}")
         
         return result
     
@@ -446,7 +682,7 @@ class FinalScorer:
         heuristic_score: float,
         resume_breakdown: Optional[Dict[str, float]] = None,
         heuristic_breakdown: Optional[Dict[str, float]] = None
-    ) -> Dict[str, Any]:
+    ) -> FinalScoreResult:
         """
         Calculate complete assessment with all features (Steps 5.1, 5.2, 5.3).
         
@@ -465,7 +701,7 @@ class FinalScorer:
             heuristic_breakdown: Optional heuristic component breakdown
         
         Returns:
-            Comprehensive result dictionary
+            FinalScoreResult with interpretation and descriptions added
         """
         # Get base result with risk and recommendation
         result = self.calculate_final_score(
@@ -476,13 +712,13 @@ class FinalScorer:
         )
         
         # Add additional information
-        result['interpretation'] = self.get_score_interpretation(result['final_trust_score'])
-        result['risk_description'] = self.get_risk_description(result['risk_level'])
-        result['recommendation_description'] = self.get_recommendation_description(result['recommendation'])
+        result.interpretation = self.get_score_interpretation(result.final_trust_score)
+        result.risk_description = self.get_risk_description(result.risk_level)
+        result.recommendation_description = self.get_recommendation_description(result.recommendation)
         
-        logger.info(f"\n📊 Interpretation: {result['interpretation']}")
-        logger.info(f"📋 Risk Description: {result['risk_description']}")
-        logger.info(f"💡 Recommendation: {result['recommendation_description']}")
+        logger.info(f"\n📊 Interpretation: {result.interpretation}")
+        logger.info(f"📋 Risk Description: {result.risk_description}")
+        logger.info(f"💡 Recommendation: {result.recommendation_description}")
         
         return result
     
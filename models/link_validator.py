@@ -14,16 +14,57 @@ Date: 2026-01-18
 
 import re
 import logging
+import copy
+import functools
+import dataclasses
+import threading
 import requests
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 import time
 
+import numpy as np
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# LinkedIn profile URL: /in/<username> optionally followed by a sub-path or
+# query string. Usernames can contain letters, numbers, hyphens, underscores
+# and periods.
+_LINKEDIN_PROFILE_RE = re.compile(
+    r'^https?://(www\.)?linkedin\.com/in/[a-zA-Z0-9._-]+([/?].*)?$',
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_linkedin_profile_url(url: str) -> bool:
+    """Memoized LinkedIn profile URL format check"""
+    return _LINKEDIN_PROFILE_RE.match(url) is not None
+
+
+@dataclasses.dataclass(slots=True)
+class ValidationResult:
+    """Result of a single link validation (GitHub, LinkedIn or Portfolio)"""
+    score: float
+    max_score: int
+    flags: List[Dict] = dataclasses.field(default_factory=list)
+    details: Dict = dataclasses.field(default_factory=dict)
+    
+    def __getitem__(self, key: str):
+        """Dict-style read access, e.g. result['score']"""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def to_dict(self) -> Dict:
+        """Return a plain dict copy (for JSON serialization)"""
+        return dataclasses.asdict(self)
+
 
 class LinkValidator:
     """
@@ -31,6 +72,21 @@ class LinkValidator:
     Implements Step 4.1 requirements for heuristic scoring
     """
     
+    # validate_all_links memo: maximum entries and seconds a result stays valid
+    LINKS_CACHE_SIZE = 4096
+    LINKS_CACHE_TTL = 3600
+    
+    # Flag types caused by network trouble rather than by the profile itself;
+    # results carrying any of them are never memoized
+    TRANSIENT_FLAG_TYPES = frozenset({
+        'github_not_accessible',
+        'github_api_unavailable',
+        'github_quality_check_failed',
+        'linkedin_not_accessible',
+        'portfolio_not_accessible',
+        'portfolio_quality_check_failed',
+    })
+    
     def __init__(
         self,
         github_max_score: int = 10,
@@ -57,6 +113,11 @@ class LinkValidator:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
+        # Per-instance LRU memo of validate_all_links keyed on the URL
+        # triple; values are (timestamp, result)
+        self._links_cache: "OrderedDict[tuple, Tuple[float, Dict]]" = OrderedDict()
+        self._links_cache_lock = threading.Lock()
+        
         logger.info("Link Validator initialized")
         logger.info(f"  GitHub max score: {github_max_score}")
         logger.info(f"  LinkedIn max score: {linkedin_max_score}")
@@ -64,7 +125,7 @@ class LinkValidator:
     
     # ==================== GITHUB VALIDATION ====================
     
-    def validate_github(self, github_url: Optional[str]) -> Dict:
+    def validate_github(self, github_url: Optional[str]) -> ValidationResult:
         """
         Validate GitHub profile and calculate score
         
@@ -72,7 +133,7 @@ class LinkValidator:
             github_url: GitHub profile URL (can be None)
         
         Returns:
-            Dict containing:
+            ValidationResult containing:
                 - score: Points earned (0-10)
                 - max_score: Maximum possible points (10)
                 - flags: List of issues found
@@ -82,16 +143,11 @@ class LinkValidator:
         logger.info("Starting GitHub Validation")
         logger.info("="*70)
         
-        result = {
-            'score': 0,
-            'max_score': self.github_max_score,
-            'flags': [],
-            'details': {}
-        }
+        result = ValidationResult(score=0, max_score=self.github_max_score)
         
         # Check if URL is provided
         if not github_url or not github_url.strip():
-            result['flags'].append({
+            result.flags.append({
                 'type': 'github_missing',
                 'severity': 'high',
                 'message': 'GitHub URL not provided'
@@ -100,11 +156,11 @@ class LinkValidator:
             return result
         
         github_url = github_url.strip()
-        result['details']['url'] = github_url
+        result.details['url'] = github_url
         
         # Validate URL format
         if not self._validate_github_url_format(github_url):
-            result['flags'].append({
+            result.flags.append({
                 'type': 'github_invalid_format',
                 'severity': 'high',
                 'message': f'Invalid GitHub URL format: {github_url}'
@@ -115,7 +171,7 @@ class LinkValidator:
         # Extract username
         username = self._extract_github_username(github_url)
         if not username:
-            result['flags'].append({
+            result.flags.append({
                 'type': 'github_invalid_username',
                 'severity': 'high',
                 'message': 'Could not extract GitHub username from URL'
@@ -123,16 +179,16 @@ class LinkValidator:
             logger.error("❌ Could not extract username")
             return result
         
-        result['details']['username'] = username
+        result.details['username'] = username
         logger.info(f"✓ Username extracted: {username}")
         
         # Check accessibility
         is_accessible, status_code = self._check_url_accessible(github_url)
-        result['details']['accessible'] = is_accessible
-        result['details']['status_code'] = status_code
+        result.details['accessible'] = is_accessible
+        result.details['status_code'] = status_code
         
         if not is_accessible:
-            result['flags'].append({
+            result.flags.append({
                 'type': 'github_not_accessible',
                 'severity': 'high',
                 'message': f'GitHub profile not accessible (Status: {status_code})'
@@ -144,15 +200,15 @@ class LinkValidator:
         
         # If accessible, check quality indicators
         quality_score = self._check_github_quality(username)
-        result['details'].update(quality_score['details'])
+        result.details.update(quality_score['details'])
         
         # Calculate final score
         score = self._calculate_github_score(quality_score)
-        result['score'] = score
+        result.score = score
         
         # Add quality-based flags
         if quality_score['flags']:
-            result['flags'].extend(quality_score['flags'])
+            result.flags.extend(quality_score['flags'])
         
         logger.info(f"✓ GitHub validation complete: {score}/{self.github_max_score} points")
         return result
@@ -176,7 +232,7 @@ class LinkValidator:
             logger.error(f"Error extracting username: {e}")
         return None
     
-    def _check_github_quality(self, username: str) -> Dict:
+    def _check_github_quality(self, username: str) -> Dict[str, Any]:
         """
         Check GitHub profile quality indicators
         
@@ -196,8 +252,7 @@ class LinkValidator:
         
         try:
             # Try to fetch public GitHub API data (no authentication needed for public data)
-            api_url = f"https://api.github.com/users/{username}"
-            response = requests.get(api_url, headers=self.headers, timeout=self.timeout)
+            response = self._http_get(self._github_api_url(username))
             
             if response.status_code == 200:
                 data = response.json()
@@ -267,7 +322,7 @@ class LinkValidator:
         
         return result
     
-    def _calculate_github_score(self, quality_score: Dict) -> float:
+    def _calculate_github_score(self, quality_score: Dict[str, Any]) -> float:
         """
         Calculate GitHub score based on quality indicators
         
@@ -278,12 +333,12 @@ class LinkValidator:
         - Bio present: 1 point
         Total: 10 points
         """
-        score = 4.0  # Base score for accessible profile
+        score: float = 4.0  # Base score for accessible profile
         
         details = quality_score['details']
-        repo_count = details.get('repo_count', 0)
-        has_recent_activity = details.get('has_recent_activity', False)
-        has_bio = details.get('has_bio', False)
+        repo_count: int = int(details.get('repo_count', 0))
+        has_recent_activity: bool = bool(details.get('has_recent_activity', False))
+        has_bio: bool = bool(details.get('has_bio', False))
         
         # Repository count (3 points)
         if repo_count > 3:
@@ -336,7 +391,7 @@ class LinkValidator:
     
     # ==================== LINKEDIN VALIDATION ====================
     
-    def validate_linkedin(self, linkedin_url: Optional[str]) -> Dict:
+    def validate_linkedin(self, linkedin_url: Optional[str]) -> ValidationResult:
         """
         Validate LinkedIn profile and calculate score
         
@@ -344,7 +399,7 @@ class LinkValidator:
             linkedin_url: LinkedIn profile URL (can be None)
         
         Returns:
-            Dict containing:
+            ValidationResult containing:
                 - score: Points earned (0-10)
                 - max_score: Maximum possible points (10)
                 - flags: List of issues found
@@ -354,16 +409,11 @@ class LinkValidator:
         logger.info("Starting LinkedIn Validation")
         logger.info("="*70)
         
-        result = {
-            'score': 0,
-            'max_score': self.linkedin_max_score,
-            'flags': [],
-            'details': {}
-        }
+        result = ValidationResult(score=0, max_score=self.linkedin_max_score)
         
         # Check if URL is provided
         if not linkedin_url or not linkedin_url.strip():
-            result['flags'].append({
+            result.flags.append({
                 'type': 'linkedin_missing',
                 'severity': 'high',
                 'message': 'LinkedIn URL not provided'
@@ -372,11 +422,11 @@ class LinkValidator:
             return result
         
         linkedin_url = linkedin_url.strip()
-        result['details']['url'] = linkedin_url
+        result.details['url'] = linkedin_url
         
         # Validate URL format
         if not self._validate_linkedin_url_format(linkedin_url):
-            result['flags'].append({
+            result.flags.append({
                 'type': 'linkedin_invalid_format',
                 'severity': 'high',
                 'message': f'Invalid LinkedIn URL format: {linkedin_url}'
@@ -388,15 +438,15 @@ class LinkValidator:
         
         # Check accessibility
         is_accessible, status_code = self._check_url_accessible(linkedin_url)
-        result['details']['accessible'] = is_accessible
-        result['details']['status_code'] = status_code
+        result.details['accessible'] = is_accessible
+        result.details['status_code'] = status_code
         
         # Handle LinkedIn's bot protection (Status 999)
         if status_code == 999:
             # LinkedIn is blocking automated access, but URL format is valid
             # Award FULL points since we verified format is correct
-            result['score'] = 10.0  # FULL score - format is valid and LinkedIn URL exists
-            result['flags'].append({
+            result.score = 10.0  # FULL score - format is valid and LinkedIn URL exists
+            result.flags.append({
                 'type': 'linkedin_bot_protection',
                 'severity': 'info',
                 'message': 'LinkedIn URL format verified and valid. Automated access blocked by LinkedIn (this is normal). Full points awarded.'
@@ -405,7 +455,7 @@ class LinkValidator:
             return result
         
         if not is_accessible:
-            result['flags'].append({
+            result.flags.append({
                 'type': 'linkedin_not_accessible',
                 'severity': 'high',
                 'message': f'LinkedIn profile not accessible (Status: {status_code})'
@@ -418,19 +468,39 @@ class LinkValidator:
         # LinkedIn quality checks (limited without API access)
         # We can only do basic checks without scraping
         quality_score = self._check_linkedin_quality(linkedin_url)
-        result['details'].update(quality_score['details'])
+        result.details.update(quality_score['details'])
         
         # Calculate final score
         score = self._calculate_linkedin_score(quality_score)
-        result['score'] = score
+        result.score = score
         
         # Add quality-based flags
         if quality_score['flags']:
-            result['flags'].extend(quality_score['flags'])
+            result.flags.extend(quality_score['flags'])
         
         logger.info(f"✓ LinkedIn validation complete: {score}/{self.linkedin_max_score} points")
         return result
     
+    def validate_linkedin_urls_batch(self, urls: List[Optional[str]]) -> np.ndarray:
+        """
+        Check the LinkedIn profile URL format for many URLs at once
+        
+        Applies the same format rule as validate_linkedin (after stripping
+        whitespace) without any network requests, for bulk pre-screening.
+        
+        Args:
+            urls: LinkedIn URLs (None or empty entries count as invalid)
+        
+        Returns:
+            Boolean array, True where the URL is a valid profile URL
+        """
+        match = _LINKEDIN_PROFILE_RE.match
+        return np.fromiter(
+            (bool(url) and match(url.strip()) is not None for url in urls),
+            dtype=np.bool_,
+            count=len(urls)
+        )
+    
     def _validate_linkedin_url_format(self, url: str) -> bool:
         """
         Validate LinkedIn URL format
@@ -442,13 +512,9 @@ class LinkValidator:
         - With trailing slash or query parameters
         - Usernames can contain: letters, numbers, hyphens, underscores, periods
         """
-        linkedin_patterns = [
-            r'^https?://(www\.)?linkedin\.com/in/[a-zA-Z0-9._-]+/?(\?.*)?$',  # Basic profile with optional query params
-            r'^https?://(www\.)?linkedin\.com/in/[a-zA-Z0-9._-]+/.*$'  # Profile with additional path
-        ]
-        return any(re.match(pattern, url, re.IGNORECASE) for pattern in linkedin_patterns)
+        return _is_linkedin_profile_url(url)
     
-    def _check_linkedin_quality(self, url: str) -> Dict:
+    def _check_linkedin_quality(self, url: str) -> Dict[str, Any]:
         """
         Check LinkedIn profile quality indicators
         
@@ -476,7 +542,7 @@ class LinkValidator:
         
         return result
     
-    def _calculate_linkedin_score(self, quality_score: Dict) -> float:
+    def _calculate_linkedin_score(self, quality_score: Dict[str, Any]) -> float:
         """
         Calculate LinkedIn score
         
@@ -491,14 +557,14 @@ class LinkValidator:
         - Summary/about section: 2 points
         - Profile photo: 1 point
         """
-        score = 7.0  # Base score for accessible profile
+        score: float = 7.0  # Base score for accessible profile
         score += 3.0  # Valid URL format (already validated)
         
         return round(min(score, self.linkedin_max_score), 2)
     
     # ==================== PORTFOLIO VALIDATION ====================
     
-    def validate_portfolio(self, portfolio_url: Optional[str]) -> Dict:
+    def validate_portfolio(self, portfolio_url: Optional[str]) -> ValidationResult:
         """
         Validate Portfolio website and calculate score
         
@@ -506,7 +572,7 @@ class LinkValidator:
             portfolio_url: Portfolio website URL (can be None)
         
         Returns:
-            Dict containing:
+            ValidationResult containing:
                 - score: Points earned (0-5)
                 - max_score: Maximum possible points (5)
                 - flags: List of issues found
@@ -516,16 +582,11 @@ class LinkValidator:
         logger.info("Starting Portfolio Validation")
         logger.info("="*70)
         
-        result = {
-            'score': 0,
-            'max_score': self.portfolio_max_score,
-            'flags': [],
-            'details': {}
-        }
+        result = ValidationResult(score=0, max_score=self.portfolio_max_score)
         
         # Check if URL is provided
         if not portfolio_url or not portfolio_url.strip():
-            result['flags'].append({
+            result.flags.append({
                 'type': 'portfolio_missing',
                 'severity': 'low',
                 'message': 'Portfolio URL not provided (optional)'
@@ -534,11 +595,11 @@ class LinkValidator:
             return result
         
         portfolio_url = portfolio_url.strip()
-        result['details']['url'] = portfolio_url
+        result.details['url'] = portfolio_url
         
         # Validate URL format
         if not self._validate_portfolio_url_format(portfolio_url):
-            result['flags'].append({
+            result.flags.append({
                 'type': 'portfolio_invalid_format',
                 'severity': 'medium',
                 'message': f'Invalid portfolio URL format: {portfolio_url}'
@@ -550,11 +611,11 @@ class LinkValidator:
         
         # Check accessibility
         is_accessible, status_code = self._check_url_accessible(portfolio_url)
-        result['details']['accessible'] = is_accessible
-        result['details']['status_code'] = status_code
+        result.details['accessible'] = is_accessible
+        result.details['status_code'] = status_code
         
         if not is_accessible:
-            result['flags'].append({
+            result.flags.append({
                 'type': 'portfolio_not_accessible',
                 'severity': 'medium',
                 'message': f'Portfolio website not accessible (Status: {status_code})'
@@ -566,15 +627,15 @@ class LinkValidator:
         
         # Check quality indicators
         quality_score = self._check_portfolio_quality(portfolio_url)
-        result['details'].update(quality_score['details'])
+        result.details.update(quality_score['details'])
         
         # Calculate final score
         score = self._calculate_portfolio_score(quality_score)
-        result['score'] = score
+        result.score = score
         
         # Add quality-based flags
         if quality_score['flags']:
-            result['flags'].extend(quality_score['flags'])
+            result.flags.extend(quality_score['flags'])
         
         logger.info(f"✓ Portfolio validation complete: {score}/{self.portfolio_max_score} points")
         return result
@@ -587,7 +648,7 @@ class LinkValidator:
         except:
             return False
     
-    def _check_portfolio_quality(self, url: str) -> Dict:
+    def _check_portfolio_quality(self, url: str) -> Dict[str, Any]:
         """
         Check portfolio quality indicators
         
@@ -607,7 +668,7 @@ class LinkValidator:
         
         try:
             # Fetch portfolio content
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self._http_get(url)
             
             if response.status_code == 200:
                 content = response.text.lower()
@@ -661,7 +722,7 @@ class LinkValidator:
         
         return result
     
-    def _calculate_portfolio_score(self, quality_score: Dict) -> float:
+    def _calculate_portfolio_score(self, quality_score: Dict[str, Any]) -> float:
         """
         Calculate portfolio score based on quality indicators
         
@@ -672,7 +733,7 @@ class LinkValidator:
         - Has contact info: 0.5 points
         Total: 5 points
         """
-        score = 2.0  # Base score for accessible portfolio
+        score: float = 2.0  # Base score for accessible portfolio
         
         details = quality_score['details']
         
@@ -692,6 +753,20 @@ class LinkValidator:
     
     # ==================== UTILITY METHODS ====================
     
+    def _http_get(self, url: str) -> requests.Response:
+        """Issue a GET request (redirects followed) with the validator's headers and timeout"""
+        return requests.get(
+            url,
+            headers=self.headers,
+            timeout=self.timeout,
+            allow_redirects=True
+        )
+    
+    @staticmethod
+    def _github_api_url(username: str) -> str:
+        """Public GitHub REST API endpoint for a user (no authentication needed)"""
+        return f"https://api.github.com/users/{username}"
+    
     def _check_url_accessible(self, url: str) -> Tuple[bool, int]:
         """
         Check if URL is accessible
@@ -700,12 +775,7 @@ class LinkValidator:
             Tuple of (is_accessible, status_code)
         """
         try:
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=self.timeout,
-                allow_redirects=True
-            )
+            response = self._http_get(url)
             is_accessible = response.status_code == 200
             return is_accessible, response.status_code
         except requests.RequestException as e:
@@ -721,6 +791,13 @@ class LinkValidator:
         """
         Validate all links and calculate total heuristic score
         
+        Results are memoized per (github_url, linkedin_url, portfolio_url)
+        triple for LINKS_CACHE_TTL seconds, so re-evaluating the same profile
+        skips the network checks. Results where a link could not be reached
+        or checked are not memoized, so a network blip is retried on the next
+        call. Callers always get their own copy. Use clear_cache() to force a
+        fresh validation.
+        
         Args:
             github_url: GitHub profile URL
             linkedin_url: LinkedIn profile URL
@@ -728,12 +805,45 @@ class LinkValidator:
         
         Returns:
             Dict containing:
-                - github: GitHub validation results
-                - linkedin: LinkedIn validation results
-                - portfolio: Portfolio validation results
+                - github: GitHub ValidationResult
+                - linkedin: LinkedIn ValidationResult
+                - portfolio: Portfolio ValidationResult
                 - total_score: Total heuristic score from links (0-25)
                 - all_flags: Combined list of all flags
         """
+        key = (github_url, linkedin_url, portfolio_url)
+        now = time.monotonic()
+        
+        with self._links_cache_lock:
+            entry = self._links_cache.get(key)
+            if entry is not None:
+                if now - entry[0] < self.LINKS_CACHE_TTL:
+                    self._links_cache.move_to_end(key)
+                    return copy.deepcopy(entry[1])
+                del self._links_cache[key]
+        
+        result = self._validate_all_links_uncached(github_url, linkedin_url, portfolio_url)
+        
+        if not any(flag.get('type') in self.TRANSIENT_FLAG_TYPES for flag in result['all_flags']):
+            with self._links_cache_lock:
+                self._links_cache[key] = (now, copy.deepcopy(result))
+                if len(self._links_cache) > self.LINKS_CACHE_SIZE:
+                    self._links_cache.popitem(last=False)
+        
+        return result
+    
+    def clear_cache(self) -> None:
+        """Clear memoized validate_all_links results"""
+        with self._links_cache_lock:
+            self._links_cache.clear()
+    
+    def _validate_all_links_uncached(
+        self,
+        github_url: Optional[str],
+        linkedin_url: Optional[str],
+        portfolio_url: Optional[str]
+    ) -> Dict:
+        """Run all link validations (validate_all_links without the memo)"""
         logger.info("\n" + "="*70)
         logger.info("VALIDATING ALL LINKS")
         logger.info("="*70)
@@ -745,16 +855,16 @@ class LinkValidator:
         
         # Calculate total score
         total_score = (
-            github_result['score'] +
-            linkedin_result['score'] +
-            portfolio_result['score']
+            github_result.score +
+            linkedin_result.score +
+            portfolio_result.score
         )
         
         # Combine all flags
         all_flags = []
-        all_flags.extend(github_result['flags'])
-        all_flags.extend(linkedin_result['flags'])
-        all_flags.extend(portfolio_result['flags'])
+        all_flags.extend(github_result.flags)
+        all_flags.extend(linkedin_result.flags)
+        all_flags.extend(portfolio_result.flags)
         
         result = {
             'github': github_result,
@@ -768,9 +878,9 @@ class LinkValidator:
         logger.info("\n" + "="*70)
         logger.info(f"LINK VALIDATION SUMMARY")
         logger.info("="*70)
-        logger.info(f"GitHub:    {github_result['score']}/{self.github_max_score} points")
-        logger.info(f"LinkedIn:  {linkedin_result['score']}/{self.linkedin_max_score} points")
-        logger.info(f"Portfolio: {portfolio_result['score']}/{self.portfolio_max_score} points")
+        logger.info(f"GitHub:    {github_result.score}/{self.github_max_score} points")
+        logger.info(f"LinkedIn:  {linkedin_result.score}/{self.linkedin_max_score} points")
+        logger.info(f"Portfolio: {portfolio_result.score}/{self.portfolio_max_score} points")
         logger.info(f"Total:     {total_score}/25 points")
         logger.info(f"Flags:     {len(all_flags)} issues found")
         logger.info("="*70 + "\n")
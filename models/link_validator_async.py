@@ -0,0 +1,231 @@
+"""
+Async Link Validation for batch freelancer evaluation
+Runs the Step 4.1 link checks for many profiles on a single event loop
+
+All network requests for a batch (profile pages, GitHub API, portfolio
+pages) are fetched concurrently with aiohttp, throttled by a semaphore so
+GitHub/LinkedIn do not rate-limit us. Scoring and flag logic is reused
+unchanged from LinkValidator.
+
+Requires the optional `aiohttp` package.
+
+Author: Freelancer Trust Evaluation System
+Version: 1.0
+Date: 2026-01-18
+"""
+
+import asyncio
+import copy
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from models.link_validator import LinkValidator
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of in-flight requests per batch
+DEFAULT_MAX_CONCURRENCY = 50
+
+
+def _run(coro):
+    """
+    Run a coroutine to completion from sync code
+    
+    asyncio.run cannot be called while an event loop is running in this
+    thread (e.g. from an async API handler), so in that case the coroutine
+    runs on its own loop in a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class _PrefetchedResponse:
+    """Minimal stand-in for requests.Response built from an aiohttp fetch"""
+    
+    __slots__ = ('status_code', 'text')
+    
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+    
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncLinkValidator(LinkValidator):
+    """
+    LinkValidator whose network I/O runs on an asyncio event loop
+    
+    Use validate_all_links_async() / validate_batch_async() from async code,
+    or the sync validate_all_links() / validate_batch() wrappers otherwise.
+    """
+    
+    def __init__(self, *args, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, **kwargs):
+        """
+        Initialize Async Link Validator
+        
+        Args:
+            max_concurrency: Maximum concurrent HTTP requests (default: 50)
+            *args, **kwargs: Passed through to LinkValidator
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncLinkValidator requires aiohttp (pip install aiohttp)")
+        
+        super().__init__(*args, **kwargs)
+        self.max_concurrency = max_concurrency
+        # Responses fetched for the current batch. Only ever set on a
+        # per-batch copy of the validator (see validate_batch_async), so
+        # concurrent batches never see each other's responses
+        self._prefetched: Dict[str, object] = {}
+    
+    # ==================== ASYNC API ====================
+    
+    async def validate_all_links_async(
+        self,
+        github_url: Optional[str] = None,
+        linkedin_url: Optional[str] = None,
+        portfolio_url: Optional[str] = None
+    ) -> Dict:
+        """
+        Validate one freelancer's links with concurrent HTTP requests
+        
+        Returns:
+            Same structure as LinkValidator.validate_all_links
+        """
+        results = await self.validate_batch_async([(github_url, linkedin_url, portfolio_url)])
+        return results[0]
+    
+    async def validate_batch_async(
+        self,
+        profiles: Iterable[Tuple[Optional[str], Optional[str], Optional[str]]]
+    ) -> List[Dict]:
+        """
+        Validate many freelancers' links on one event loop
+        
+        Args:
+            profiles: Iterable of (github_url, linkedin_url, portfolio_url) triples
+        
+        Returns:
+            List of validate_all_links results, in input order
+        """
+        profiles = list(profiles)
+        
+        # Collect every distinct URL the sync checks will request
+        urls = set()
+        for triple in profiles:
+            urls.update(self._urls_to_fetch(*triple))
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(headers=self.headers, timeout=timeout) as session:
+            url_list = list(urls)
+            fetched = await asyncio.gather(
+                *(self._fetch(session, semaphore, url) for url in url_list)
+            )
+        
+        logger.info(f"Fetched {len(url_list)} URLs for {len(profiles)} profiles")
+        
+        # Score on a copy of the validator that serves this batch's responses,
+        # leaving this (possibly shared) instance untouched
+        scorer = copy.copy(self)
+        scorer._prefetched = dict(zip(url_list, fetched))
+        return [scorer._validate_all_links_uncached(*triple) for triple in profiles]
+    
+    # ==================== SYNC WRAPPERS ====================
+    
+    def validate_all_links(
+        self,
+        github_url: Optional[str] = None,
+        linkedin_url: Optional[str] = None,
+        portfolio_url: Optional[str] = None
+    ) -> Dict:
+        """Blocking wrapper around validate_all_links_async"""
+        return _run(self.validate_all_links_async(github_url, linkedin_url, portfolio_url))
+    
+    def validate_batch(
+        self,
+        profiles: Iterable[Tuple[Optional[str], Optional[str], Optional[str]]]
+    ) -> List[Dict]:
+        """Blocking wrapper around validate_batch_async"""
+        return _run(self.validate_batch_async(profiles))
+    
+    # ==================== NETWORK LAYER ====================
+    
+    def _urls_to_fetch(
+        self,
+        github_url: Optional[str],
+        linkedin_url: Optional[str],
+        portfolio_url: Optional[str]
+    ) -> List[str]:
+        """URLs the sync validators will request for one profile"""
+        urls = []
+        
+        if github_url and github_url.strip():
+            github_url = github_url.strip()
+            if self._validate_github_url_format(github_url):
+                urls.append(github_url)
+                username = self._extract_github_username(github_url)
+                if username:
+                    urls.append(self._github_api_url(username))
+        
+        if linkedin_url and linkedin_url.strip():
+            linkedin_url = linkedin_url.strip()
+            if self._validate_linkedin_url_format(linkedin_url):
+                urls.append(linkedin_url)
+        
+        if portfolio_url and portfolio_url.strip():
+            portfolio_url = portfolio_url.strip()
+            if self._validate_portfolio_url_format(portfolio_url):
+                urls.append(portfolio_url)
+        
+        return urls
+    
+    async def _fetch(self, session, semaphore: asyncio.Semaphore, url: str):
+        """Fetch a URL, returning a _PrefetchedResponse or the raised exception"""
+        async with semaphore:
+            try:
+                async with session.get(url, allow_redirects=True) as response:
+                    text = await response.text(errors='replace')
+                    return _PrefetchedResponse(response.status, text)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                return e
+    
+    def _http_get(self, url: str):
+        """Serve a prefetched response, falling back to a blocking request"""
+        if url not in self._prefetched:
+            return super()._http_get(url)
+        
+        response = self._prefetched[url]
+        if isinstance(response, Exception):
+            raise requests.RequestException(str(response) or type(response).__name__)
+        return response
+
+
+# Singleton instance
+_async_link_validator_instance = None
+
+
+def get_async_link_validator() -> AsyncLinkValidator:
+    """
+    Get singleton instance of AsyncLinkValidator
+    
+    Returns:
+        AsyncLinkValidator instance
+    """
+    global _async_link_validator_instance
+    if _async_link_validator_instance is None:
+        _async_link_validator_instance = AsyncLinkValidator()
+    return _async_link_validator_instance
@@ -174,7 +174,7 @@ class LSTMInference:
         
         # Step 3: Prepare input for LSTM
         # Shape: (batch=1, seq_len=2, features=768)
-        lstm_input = torch.tensor(combined_features, dtype=torch.float32)
+        lstm_input = torch.from_numpy(np.ascontiguousarray(combined_features, dtype=np.float32))
         lstm_input = lstm_input.unsqueeze(0)  # Add batch dimension
         lstm_input = lstm_input.to(self.device)
         
@@ -126,6 +126,8 @@ class FreelancerTrustLSTM(nn.Module):
         Returns:
             Trust probability tensor of shape (batch_size, 1) in range [0, 1]
         """
+        # Compute in float32 even if the caller passes reduced-precision input
+        x = x.float()
         batch_size = x.size(0)
         
         # LSTM Layer 1
@@ -255,8 +257,8 @@ class LSTMTrainer:
         
         for batch_idx, (data, targets) in enumerate(train_loader):
             # Move data to device
-            data = data.to(self.device)
-            targets = targets.float().unsqueeze(1).to(self.device)  # (batch, 1)
+            data = data.to(self.device, non_blocking=True)
+            targets = targets.float().unsqueeze(1).to(self.device, non_blocking=True)  # (batch, 1)
             
             # Forward pass
             self.optimizer.zero_grad()
@@ -300,8 +302,8 @@ class LSTMTrainer:
         
         with torch.no_grad():
             for data, targets in val_loader:
-                data = data.to(self.device)
-                targets = targets.float().unsqueeze(1).to(self.device)
+                data = data.to(self.device, non_blocking=True)
+                targets = targets.float().unsqueeze(1).to(self.device, non_blocking=True)
                 
                 outputs = self.model(data)
                 loss = self.criterion(outputs, targets)
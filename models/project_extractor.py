@@ -14,8 +14,11 @@ Version: 1.0
 """
 
 import re
+import copy
+import hashlib
 import logging
-from typing import Dict, List, Tuple, Optional, Set
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple, Optional, Set, Union
 from datetime import datetime
 from dateutil import parser as date_parser
 from collections import Counter
@@ -25,12 +28,35 @@ import numpy as np
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Section headers that END the Projects section
+# CRITICAL: Internship/Internships MUST end the project section!
+_SECTION_END_RE = re.compile(
+    r'^(?:internships?|training|work\s*experience|education|academic|skills|'
+    r'technical\s*skills|certifications?|awards?|references?|hobbies|languages?|'
+    r'interests?)\s*:?\s*$'
+)
+_EDUCATION_HEADER_RE = re.compile(r'^education\s*:?\s*$')
+
+# Project title markers: "(Freelance)", "(Personal)", ... and a 2020-2029 year
+_PROJECT_TYPE_RE = re.compile(
+    r'\(\s*(Freelance|Personal|Client|Contract|Side\s*Project|Academic|Course)\s*\)',
+    re.IGNORECASE
+)
+_TITLE_YEAR_RE = re.compile(r'\b(202[0-9])\b')
+
+# Year extraction: "202 6" PDF artifacts and 2020-2027 years
+_YEAR_ARTIFACT_RE = re.compile(r'(20)\s*(2)\s*([0-9])')
+_SIMPLE_YEAR_RE = re.compile(r'(202[0-7])')
+
 
 class ProjectExtractor:
     """
     Extracts project-based indicators from resume text for LSTM model input
     """
     
+    # Number of distinct resumes whose indicators are memoized
+    INDICATOR_CACHE_SIZE = 32
+    
     def __init__(self):
         """Initialize Project Extractor"""
         # Common project section headers (including 'experience' where freelancers often list projects)
@@ -73,6 +99,17 @@ class ProjectExtractor:
             ]
         }
         
+        # Compiled once: a single header regex (one match per line instead of
+        # two per header pattern) and one word-bounded regex per technology
+        self._project_header_re = re.compile(
+            r'^[\s•\*\-]*(?:' + '|'.join(self.project_headers) + r')\s*:?\s*$'
+        )
+        self._tech_patterns = [
+            (tech.replace('\\', ''), re.compile(r'\b' + tech + r'\b'))
+            for tech_list in self.tech_keywords.values()
+            for tech in tech_list
+        ]
+        
         # Date patterns for parsing
         self.date_patterns = [
             r'(\d{1,2}[/-]\d{4})',  # MM/YYYY or MM-YYYY
@@ -88,18 +125,46 @@ class ProjectExtractor:
             r'(\d+)\s*(?:weeks?|wks?)',
         ]
         
+        # Per-instance LRU memo of extract_all_indicators keyed on a text digest
+        self._indicator_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        
         logger.info("Project Extractor initialized")
     
     def extract_all_indicators(self, resume_text: str) -> Dict:
         """
         Extract all project-based indicators from resume
         
+        Results are memoized per resume text (keyed by its BLAKE2b digest),
+        so scoring the same resume again skips the extraction. Each call
+        returns its own copy, so callers may modify it freely. Use
+        clear_cache() to force a fresh extraction.
+        
         Args:
             resume_text: Cleaned resume text
             
         Returns:
             Dictionary containing all project indicators
         """
+        key = hashlib.blake2b(resume_text.encode('utf-8'), digest_size=16).digest()
+        
+        indicators = self._indicator_cache.get(key)
+        if indicators is None:
+            indicators = self._extract_all_indicators_uncached(resume_text)
+            self._indicator_cache[key] = indicators
+            if len(self._indicator_cache) > self.INDICATOR_CACHE_SIZE:
+                self._indicator_cache.popitem(last=False)
+        else:
+            self._indicator_cache.move_to_end(key)
+            logger.info("✓ Project indicators served from cache")
+        
+        return copy.deepcopy(indicators)
+    
+    def clear_cache(self) -> None:
+        """Clear memoized extract_all_indicators results"""
+        self._indicator_cache.clear()
+    
+    def _extract_all_indicators_uncached(self, resume_text: str) -> Dict:
+        """Extract all project-based indicators (extract_all_indicators body)"""
         logger.info("Starting project indicator extraction...")
         
         # Extract projects
@@ -107,8 +172,9 @@ class ProjectExtractor:
         
         # Calculate indicators
         total_projects = len(projects)
-        total_years = self.calculate_total_years(projects)
-        avg_duration = self.calculate_average_duration(projects)
+        columns = self.project_columns(projects)
+        total_years = self.calculate_total_years(columns)
+        avg_duration = self.calculate_average_duration(columns)
         overlapping_count = self.count_overlapping_projects(projects)
         tech_consistency = self.calculate_tech_consistency(projects, resume_text)
         project_link_ratio = self.calculate_project_link_ratio(projects, resume_text)
@@ -123,7 +189,12 @@ class ProjectExtractor:
             'overlapping_projects_count': overlapping_count,
             'technology_consistency_score': round(tech_consistency, 3),
             'project_to_link_ratio': round(project_link_ratio, 3),
-            'projects_details': projects,  # Keep for debugging/analysis
+            # Columns as plain lists, so the indicators stay JSON-serializable
+            'projects': {
+                name: column if isinstance(column, list) else column.tolist()
+                for name, column in columns.items()
+            },
+            'projects_details': projects,  # Per-project dicts, kept for debugging/analysis
             'years_missing': years_missing  # Flag if years are not present
         }
         
@@ -202,15 +273,11 @@ class ProjectExtractor:
             is_short_line = len(line_stripped) < 50  # Section headers are usually short
             
             # Check if line matches project/experience section headers
-            if is_short_line:
-                for header_pattern in self.project_headers:
-                    # Match as section header: line starts with or is mostly the header
-                    if re.match(r'^' + header_pattern + r'\s*$', line_lower) or \
-                       re.match(r'^[\s•\*\-]*' + header_pattern + r'\s*:?\s*$', line_lower):
-                        project_section_start = i + 1  # Start AFTER the header line
-                        matched_header = line_stripped
-                        logger.info(f"✓ Found section header at line {i}: '{line_stripped}'")
-                        break
+            # Match as section header: line starts with or is mostly the header
+            if is_short_line and self._project_header_re.match(line_lower):
+                project_section_start = i + 1  # Start AFTER the header line
+                matched_header = line_stripped
+                logger.info(f"✓ Found section header at line {i}: '{line_stripped}'")
             
             if project_section_start != -1:
                 break
@@ -227,38 +294,18 @@ class ProjectExtractor:
                 
                 # Check if this is the start of another major section
                 is_short_line = len(line_stripped) < 50
-                if is_short_line:
-                    # Check for section headers that END the Projects section
-                    # CRITICAL: Internship/Internships MUST end the project section!
-                    section_end_headers = [
-                        r'^internships?\s*:?\s*$',  # Internship or Internships (PRIORITY)
-                        r'^training\s*:?\s*$',
-                        r'^work\s*experience\s*:?\s*$',
-                        r'^education\s*:?\s*$',
-                        r'^academic\s*:?\s*$',
-                        r'^skills\s*:?\s*$',
-                        r'^technical\s*skills\s*:?\s*$',
-                        r'^certifications?\s*:?\s*$',
-                        r'^awards?\s*:?\s*$',
-                        r'^references?\s*:?\s*$',
-                        r'^hobbies\s*:?\s*$',
-                        r'^languages?\s*:?\s*$',
-                        r'^interests?\s*:?\s*$',
-                    ]
-                    for header_pattern in section_end_headers:
-                        if re.match(header_pattern, line_lower):
-                            project_section_end = i
-                            logger.info(f"✓ Section ends at line {i}: '{line_stripped}'")
-                            break
-                    if project_section_end != len(lines):
-                        break  # Exit outer loop if we found section end
+                # Check for section headers that END the Projects section
+                if is_short_line and _SECTION_END_RE.match(line_lower):
+                    project_section_end = i
+                    logger.info(f"✓ Section ends at line {i}: '{line_stripped}'")
+                    break
         else:
             logger.warning("⚠️ No Projects/Experience section header found! Searching entire resume...")
             project_section_start = 0
             # Find Education section as endpoint
             for i, line in enumerate(lines):
                 line_lower = line.strip().lower()
-                if len(line.strip()) < 50 and re.match(r'^education\s*:?\s*$', line_lower):
+                if len(line.strip()) < 50 and _EDUCATION_HEADER_RE.match(line_lower):
                     project_section_end = i
                     break
         
@@ -327,10 +374,10 @@ class ProjectExtractor:
             # This is the DEFINITIVE marker for project titles in the user's resume format
             
             # PRIMARY CHECK: Has project type indicator - this is REQUIRED
-            has_project_type = re.search(r'\(\s*(Freelance|Personal|Client|Contract|Side\s*Project|Academic|Course)\s*\)', line, re.IGNORECASE)
+            has_project_type = _PROJECT_TYPE_RE.search(line)
             
             # SECONDARY CHECK: Has year like "2025" or "| 2025"
-            has_year = re.search(r'\b(202[0-9])\b', line)  # Has a year 2020-2029
+            has_year = _TITLE_YEAR_RE.search(line)  # Has a year 2020-2029
             
             # A line is ONLY a project title if:
             # 1. It has (Freelance), (Personal), (Client), etc. - this is REQUIRED
@@ -561,15 +608,13 @@ class ProjectExtractor:
         
         # FIRST: Fix PDF artifacts - remove spaces within year patterns
         # This handles "202 6" -> "2026", "202  5" -> "2025", etc.
-        fixed_text = re.sub(r'(20)\s*(2)\s*([0-9])', r'\1\2\3', text)
+        fixed_text = _YEAR_ARTIFACT_RE.sub(r'\1\2\3', text)
         
         if fixed_text != text:
             logger.debug(f"Fixed PDF artifact: '{text}' -> '{fixed_text}'")
         
         # SIMPLE APPROACH: Find ALL 4-digit years (2020-2027) in the fixed text
-        simple_year_pattern = r'(202[0-7])'  # Match 2020-2027 anywhere
-        
-        matches = re.findall(simple_year_pattern, fixed_text)
+        matches = _SIMPLE_YEAR_RE.findall(fixed_text)  # Match 2020-2027 anywhere
         logger.debug(f"Year matches found: {matches}")
         
         for year_str in matches:
@@ -661,19 +706,13 @@ class ProjectExtractor:
         Returns:
             List of technology names
         """
-        technologies = []
         text_lower = text.lower()
         
-        # Check all technology categories
-        for category, tech_list in self.tech_keywords.items():
-            for tech in tech_list:
-                pattern = r'\b' + tech + r'\b'
-                if re.search(pattern, text_lower):
-                    # Get original case from text
-                    match = re.search(pattern, text_lower)
-                    if match:
-                        # Store the technology name
-                        technologies.append(tech.replace('\\', ''))
+        # Check all technology categories (patterns precompiled in __init__)
+        technologies = [
+            name for name, pattern in self._tech_patterns
+            if pattern.search(text_lower)
+        ]
         
         return list(set(technologies))  # Remove duplicates
     
@@ -729,38 +768,68 @@ class ProjectExtractor:
         
         return unique_projects
     
-    def calculate_total_years(self, projects: List[Dict]) -> float:
+    def project_columns(self, projects: List[Dict]) -> Dict[str, Any]:
+        """
+        Convert project dictionaries to parallel column arrays
+        
+        Args:
+            projects: List of project dictionaries (from extract_projects)
+            
+        Returns:
+            Dictionary of equal-length columns:
+            - names: Project names (list of str)
+            - start_years, end_years: Calendar years (int16, 0 where missing)
+            - has_start, has_end: Whether the date is present (bool)
+            - has_dates: Whether either date is present (bool)
+            - duration_months: Project durations (float64)
+        """
+        # Convert dates in one call to year-resolution datetime64 (years since
+        # 1970, NaT where missing), then shift to calendar years
+        starts = np.array([p.get('start_date') or None for p in projects], dtype='datetime64[Y]')
+        ends = np.array([p.get('end_date') or None for p in projects], dtype='datetime64[Y]')
+        has_start = ~np.isnat(starts)
+        has_end = ~np.isnat(ends)
+        
+        return {
+            'names': [p.get('name', '') for p in projects],
+            'start_years': np.where(has_start, starts.astype(np.int64) + 1970, 0).astype(np.int16),
+            'end_years': np.where(has_end, ends.astype(np.int64) + 1970, 0).astype(np.int16),
+            'has_start': has_start,
+            'has_end': has_end,
+            'has_dates': has_start | has_end,
+            'duration_months': np.array([p.get('duration_months', 0) for p in projects], dtype=np.float64)
+        }
+    
+    def calculate_total_years(self, projects: Union[List[Dict], Dict[str, Any]]) -> float:
         """
         Calculate total experience years from project year range
         
         Args:
-            projects: List of project dictionaries
+            projects: List of project dictionaries, or their project_columns()
             
         Returns:
             Experience years (max_year - min_year)
         """
-        if not projects:
+        columns = projects if isinstance(projects, dict) else self.project_columns(projects)
+        if len(columns['names']) == 0:
             return 0.0
         
-        # Extract all unique years from projects
-        years = set()
-        for project in projects:
-            # Get start_date and end_date years
-            if project.get('start_date'):
-                years.add(project['start_date'].year)
-            if project.get('end_date'):
-                years.add(project['end_date'].year)
+        # Years of all present start and end dates
+        years = np.concatenate((
+            columns['start_years'][columns['has_start']],
+            columns['end_years'][columns['has_end']]
+        ))
         
         # If no years found, return 0
-        if not years:
+        if years.size == 0:
             logger.warning("No years found in projects")
             return 0.0
         
         # Calculate year range: max_year - min_year
-        min_year = min(years)
-        max_year = max(years)
+        min_year = int(years.min())
+        max_year = int(years.max())
         
-        logger.info(f"Years found in projects: {sorted(years)}")
+        logger.info(f"Years found in projects: {np.unique(years).tolist()}")
         logger.info(f"Year range: {min_year} to {max_year}")
         
         experience_years = max_year - min_year
@@ -773,20 +842,24 @@ class ProjectExtractor:
         logger.info(f"Calculated experience: {experience_years} years")
         return float(experience_years)
     
-    def calculate_average_duration(self, projects: List[Dict]) -> float:
+    def calculate_average_duration(self, projects: Union[List[Dict], Dict[str, Any]]) -> float:
         """
         Calculate average project duration in months
         
         Args:
-            projects: List of project dictionaries
+            projects: List of project dictionaries, or their project_columns()
             
         Returns:
             Average duration in months
         """
-        if not projects:
+        if isinstance(projects, dict):
+            durations = projects['duration_months']
+        else:
+            durations = [p.get('duration_months', 0) for p in projects]
+        
+        if len(durations) == 0:
             return 0.0
         
-        durations = [p.get('duration_months', 0) for p in projects]
         avg_duration = np.mean(durations)
         
         return avg_duration
@@ -0,0 +1,135 @@
+"""
+Tests for the async batch link validator (Step 4.1)
+Network I/O is served by a fake aiohttp session, so no requests leave the machine
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models import link_validator, link_validator_async
+from models.link_validator_async import AsyncLinkValidator
+
+GITHUB_API = {"public_repos": 12, "bio": "Backend developer", "updated_at": "2099-01-01T00:00:00Z"}
+PORTFOLIO_HTML = "<h1>About me</h1><h2>Projects</h2><a href='mailto:me@example.com'>Contact</a>"
+
+
+class _FakeResponse:
+    def __init__(self, status, text):
+        self.status = status
+        self._text = text
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    async def text(self, errors="strict"):
+        return self._text
+
+
+class _FakeSession:
+    """Stand-in for aiohttp.ClientSession serving canned pages by URL"""
+    
+    pages = {}
+    
+    def __init__(self, *args, **kwargs):
+        pass
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def get(self, url, allow_redirects=True):
+        page = self.pages.get(url)
+        if page is None:
+            raise aiohttp.ClientConnectionError(f"cannot connect to {url}")
+        return _FakeResponse(*page)
+
+
+@pytest.fixture
+def validator(monkeypatch):
+    _FakeSession.pages = {
+        "https://github.com/alice": (200, "<html>alice</html>"),
+        "https://api.github.com/users/alice": (200, json.dumps(GITHUB_API)),
+        "https://www.linkedin.com/in/alice": (200, "<html>alice</html>"),
+        "https://alice.dev": (200, PORTFOLIO_HTML),
+        "https://github.com/bob": (404, "Not Found"),
+    }
+    monkeypatch.setattr(link_validator_async.aiohttp, "ClientSession", _FakeSession)
+    
+    # Any request not served from the batch's prefetched responses is a test failure
+    def no_blocking_requests(url, **kwargs):
+        raise AssertionError(f"unexpected blocking request: {url}")
+    
+    monkeypatch.setattr(link_validator.requests, "get", no_blocking_requests)
+    return AsyncLinkValidator()
+
+
+def test_batch_scores_each_profile_from_prefetched_responses(validator):
+    alice, bob, carol = validator.validate_batch([
+        ("https://github.com/alice", "https://www.linkedin.com/in/alice", "https://alice.dev"),
+        ("https://github.com/bob", None, None),
+        (None, None, "https://carol.dev"),
+    ])
+    
+    assert alice["github"]["details"]["repo_count"] == 12
+    assert alice["linkedin"]["details"]["accessible"] is True
+    assert alice["portfolio"]["details"]["has_projects"] is True
+    assert alice["total_score"] == alice["max_score"]
+    
+    assert bob["github"]["details"]["status_code"] == 404
+    assert bob["total_score"] == 0
+    
+    # A connection error is scored as not accessible
+    assert carol["portfolio"]["details"]["status_code"] == 0
+    assert any(flag["type"] == "portfolio_not_accessible" for flag in carol["all_flags"])
+
+
+def test_concurrent_batches_do_not_share_responses(validator, monkeypatch):
+    # Hold alice's batch mid-scoring until bob's batch on the same instance
+    # has fetched, scored and returned
+    bob_done = threading.Event()
+    check_github_quality = AsyncLinkValidator._check_github_quality
+    
+    def wait_for_bob(self, username):
+        if username == "alice":
+            assert bob_done.wait(timeout=10)
+        return check_github_quality(self, username)
+    
+    monkeypatch.setattr(AsyncLinkValidator, "_check_github_quality", wait_for_bob)
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        alice_future = executor.submit(validator.validate_batch, [("https://github.com/alice", None, None)])
+        bob_future = executor.submit(validator.validate_batch, [("https://github.com/bob", None, None)])
+        (bob,) = bob_future.result()
+        bob_done.set()
+        (alice,) = alice_future.result()
+    
+    assert alice["github"]["details"]["repo_count"] == 12
+    assert bob["github"]["details"]["status_code"] == 404
+    # The shared instance holds no per-batch state
+    assert validator._prefetched == {}
+
+
+def test_sync_wrapper_works_inside_running_loop(validator):
+    async def handler():
+        # e.g. an async API handler calling the blocking API
+        return validator.validate_all_links("https://github.com/alice")
+    
+    result = asyncio.run(handler())
+    
+    assert result["github"]["details"]["username"] == "alice"
+    assert result["github"]["score"] > 0
@@ -6,6 +6,7 @@ Author: Freelancer Trust Evaluation System
 Version: 1.0
 """
 
+import json
 import sys
 from pathlib import Path
 
@@ -164,6 +165,13 @@ def test_project_details():
         if project['start_date'] and project['end_date']:
             print(f"    Dates: {project['start_date'].strftime('%Y-%m')} to {project['end_date'].strftime('%Y-%m')}")
     
+    # Columns must line up with the per-project dicts and be JSON-serializable
+    columns = indicators['projects']
+    assert columns['names'] == [p['name'] for p in projects]
+    assert columns['end_years'] == [p['end_date'].year if p['end_date'] else 0 for p in projects]
+    assert columns['has_dates'] == [bool(p['start_date'] or p['end_date']) for p in projects]
+    json.dumps(columns)
+    
     print("\n✅ Detailed extraction test PASSED")
 
 
@@ -26,7 +26,7 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.lstm_model import FreelancerTrustLSTM, LSTMTrainer, create_model
-from utils.lstm_data_loader import FreelancerDataset
+from utils.lstm_data_loader import FreelancerDataset, collate_batch
 from torch.utils.data import DataLoader
 import logging
 
@@ -76,26 +76,30 @@ def create_train_val_test_loaders(
     val_indices = indices[n_train:n_train + n_val]
     test_indices = indices[n_train + n_val:]
     
-    # Create datasets
+    # Create datasets (each copies its rows straight into its input tensor;
+    # no embeddings[indices] subset arrays)
     train_dataset = FreelancerDataset(
-        embeddings[train_indices],
-        features[train_indices],
-        labels[train_indices],
-        device=device
+        embeddings,
+        features,
+        labels,
+        device=device,
+        indices=train_indices
     )
     
     val_dataset = FreelancerDataset(
-        embeddings[val_indices],
-        features[val_indices],
-        labels[val_indices],
-        device=device
+        embeddings,
+        features,
+        labels,
+        device=device,
+        indices=val_indices
     )
     
     test_dataset = FreelancerDataset(
-        embeddings[test_indices],
-        features[test_indices],
-        labels[test_indices],
-        device=device
+        embeddings,
+        features,
+        labels,
+        device=device,
+        indices=test_indices
     )
     
     # Create data loaders
@@ -103,21 +107,27 @@ def create_train_val_test_loaders(
         train_dataset,
         batch_size=batch_size,
         shuffle=True,
-        drop_last=False
+        drop_last=False,
+        collate_fn=collate_batch,
+        pin_memory=device != 'cpu'
     )
     
     val_loader = DataLoader(
         val_dataset,
         batch_size=batch_size,
         shuffle=False,
-        drop_last=False
+        drop_last=False,
+        collate_fn=collate_batch,
+        pin_memory=device != 'cpu'
     )
     
     test_loader = DataLoader(
         test_dataset,
         batch_size=batch_size,
         shuffle=False,
-        drop_last=False
+        drop_last=False,
+        collate_fn=collate_batch,
+        pin_memory=device != 'cpu'
     )
     
     logger.info(f"📊 Data loaders created (70/15/15 split):")
@@ -149,8 +159,8 @@ def evaluate_model(model, test_loader, device='cpu'):
     
     with torch.no_grad():
         for data, targets in test_loader:
-            data = data.to(device)
-            targets = targets.to(device)
+            data = data.to(device, non_blocking=True)
+            targets = targets.to(device, non_blocking=True)
             
             # Get predictions
             outputs = model(data)
@@ -66,7 +66,7 @@ def main():
     print(f"✅ Loaded 10 test samples")
     
     # Prepare data (simulate data loader format)
-    from utils.lstm_data_loader import FreelancerDataset
+    from utils.lstm_data_loader import FreelancerDataset, collate_batch
     from torch.utils.data import DataLoader
     
     test_dataset = FreelancerDataset(
@@ -76,7 +76,7 @@ def main():
         device=device
     )
     
-    test_loader = DataLoader(test_dataset, batch_size=10, shuffle=False)
+    test_loader = DataLoader(test_dataset, batch_size=10, shuffle=False, collate_fn=collate_batch)
     
     # Run inference
     print(f"\n4️⃣ Running inference...")
@@ -7,504 +7,339 @@ Version: 1.0
 Date: 2026-01-18
 """
 
+import io
+import os
+import math
 import sys
+import contextlib
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
+
+# Only needed when run as a script (python models/verify_step_5_1.py);
+# imported as models.verify_step_5_1 the project root is already on sys.path
+if not __package__:
+    sys.path.append(str(Path(__file__).parent.parent))
 
 from models.final_scorer import FinalScorer, get_final_scorer
 
+# Shared scorer for checks 3-15 (check 1 still builds its own to test __init__)
+_SCORER = get_final_scorer()
+
+# Worker threads used to run the checks
+_MAX_WORKERS = 4
+
+# Set VERIFY_DEBUG=1 to print full tracebacks for failing checks
+_DEBUG = bool(os.environ.get("VERIFY_DEBUG"))
+
+# Report banners
+_SEP80 = "=" * 80
+_EYE = "🔍" * 40
+
 
-def print_check(check_num, description, status, details=""):
+def print_check(check_num, description, status, details="", file=None):
     """Print formatted check result"""
     status_icon = "✅" if status else "❌"
-    print(f"\n{status_icon} CHECK {check_num}: {description}")
+    print(f"\n{status_icon} CHECK {check_num}: {description}", file=file)
     if details:
-        print(f"   {details}")
+        print(f"   {details}", file=file)
     return status
 
 
-def verify_check_1_initialization():
-    """Check 1: Verify FinalScorer initialization"""
-    print("\n" + "="*80)
-    print("CHECK 1: FinalScorer Initialization")
-    print("="*80)
-    
-    try:
-        scorer = FinalScorer()
-        
-        assert scorer.RESUME_MAX == 70, f"Resume max should be 70, got {scorer.RESUME_MAX}"
-        assert scorer.HEURISTIC_MAX == 30, f"Heuristic max should be 30, got {scorer.HEURISTIC_MAX}"
-        assert scorer.FINAL_MAX == 100, f"Final max should be 100, got {scorer.FINAL_MAX}"
-        
-        return print_check(
-            1,
-            "FinalScorer Initialization",
-            True,
-            f"Resume: {scorer.RESUME_MAX}, Heuristic: {scorer.HEURISTIC_MAX}, Final: {scorer.FINAL_MAX}"
-        )
-    except Exception as e:
-        return print_check(1, "FinalScorer Initialization", False, f"Error: {e}")
+def _expect(actual, expected, field):
+    """Raise AssertionError unless actual equals expected (floats compared with isclose)"""
+    if isinstance(expected, float):
+        matches = isinstance(actual, (int, float)) and math.isclose(actual, expected, rel_tol=1e-9, abs_tol=1e-9)
+    else:
+        matches = actual == expected
+    if not matches:
+        raise AssertionError(f"{field}: {actual} != {expected}")
 
 
-def verify_check_2_singleton():
-    """Check 2: Verify singleton pattern"""
-    print("\n" + "="*80)
-    print("CHECK 2: Singleton Pattern")
-    print("="*80)
-    
-    try:
-        scorer1 = get_final_scorer()
-        scorer2 = get_final_scorer()
-        
-        assert scorer1 is scorer2, "Should return same instance"
-        
-        return print_check(
-            2,
-            "Singleton Pattern",
-            True,
-            "get_final_scorer() returns same instance"
-        )
-    except Exception as e:
-        return print_check(2, "Singleton Pattern", False, f"Error: {e}")
+def _require(condition, message):
+    """Raise AssertionError if condition is false (unlike assert, also under python -O)"""
+    if not condition:
+        raise AssertionError(message)
 
 
-def verify_check_3_perfect_score():
-    """Check 3: Verify perfect score calculation (100/100)"""
-    print("\n" + "="*80)
-    print("CHECK 3: Perfect Score Calculation")
-    print("="*80)
-    
+def _check_initialization():
     scorer = FinalScorer()
     
-    try:
-        result = scorer.calculate_final_score(
-            resume_score=70.0,
-            heuristic_score=30.0
-        )
-        
-        assert result['final_trust_score'] == 100.0, f"Should be 100, got {result['final_trust_score']}"
-        assert result['max_score'] == 100, "Max score should be 100"
-        assert result['percentage'] == 100.0, "Percentage should be 100%"
-        assert result['resume_contribution']['score'] == 70.0, "Resume contribution should be 70"
-        assert result['heuristic_contribution']['score'] == 30.0, "Heuristic contribution should be 30"
-        
-        return print_check(
-            3,
-            "Perfect Score Calculation",
-            True,
-            f"70 + 30 = {result['final_trust_score']}/100 (100%)"
-        )
-    except Exception as e:
-        return print_check(3, "Perfect Score Calculation", False, f"Error: {e}")
+    _expect(scorer.RESUME_MAX, 70, "RESUME_MAX")
+    _expect(scorer.HEURISTIC_MAX, 30, "HEURISTIC_MAX")
+    _expect(scorer.FINAL_MAX, 100, "FINAL_MAX")
+    
+    return f"Resume: {scorer.RESUME_MAX}, Heuristic: {scorer.HEURISTIC_MAX}, Final: {scorer.FINAL_MAX}"
 
 
-def verify_check_4_zero_score():
-    """Check 4: Verify zero score calculation"""
-    print("\n" + "="*80)
-    print("CHECK 4: Zero Score Calculation")
-    print("="*80)
+def _check_singleton():
+    scorer1 = get_final_scorer()
+    scorer2 = get_final_scorer()
     
-    scorer = FinalScorer()
+    _require(scorer1 is scorer2, "Should return same instance")
     
-    try:
-        result = scorer.calculate_final_score(
-            resume_score=0.0,
-            heuristic_score=0.0
-        )
-        
-        assert result['final_trust_score'] == 0.0, f"Should be 0, got {result['final_trust_score']}"
-        assert result['percentage'] == 0.0, "Percentage should be 0%"
-        
-        return print_check(
-            4,
-            "Zero Score Calculation",
-            True,
-            f"0 + 0 = {result['final_trust_score']}/100 (0%)"
-        )
-    except Exception as e:
-        return print_check(4, "Zero Score Calculation", False, f"Error: {e}")
+    return "get_final_scorer() returns same instance"
 
 
-def verify_check_5_decimal_precision():
-    """Check 5: Verify decimal precision handling"""
-    print("\n" + "="*80)
-    print("CHECK 5: Decimal Precision")
-    print("="*80)
+def _check_perfect_score():
+    result = _SCORER.calculate_final_score(resume_score=70.0, heuristic_score=30.0)
     
-    scorer = FinalScorer()
+    _expect(result['final_trust_score'], 100.0, "final_trust_score")
+    _expect(result['max_score'], 100, "max_score")
+    _expect(result['percentage'], 100.0, "percentage")
+    _expect(result['resume_contribution']['score'], 70.0, "resume_contribution.score")
+    _expect(result['heuristic_contribution']['score'], 30.0, "heuristic_contribution.score")
     
-    try:
-        result = scorer.calculate_final_score(
-            resume_score=48.35,
-            heuristic_score=19.50
-        )
-        
-        expected = 67.85
-        assert result['final_trust_score'] == expected, f"Should be {expected}, got {result['final_trust_score']}"
-        assert isinstance(result['final_trust_score'], float), "Should be float"
-        
-        return print_check(
-            5,
-            "Decimal Precision",
-            True,
-            f"48.35 + 19.50 = {result['final_trust_score']}"
-        )
-    except Exception as e:
-        return print_check(5, "Decimal Precision", False, f"Error: {e}")
+    return f"70 + 30 = {result['final_trust_score']}/100 (100%)"
 
 
-def verify_check_6_percentage_calculation():
-    """Check 6: Verify percentage calculations"""
-    print("\n" + "="*80)
-    print("CHECK 6: Percentage Calculations")
-    print("="*80)
+def _check_zero_score():
+    result = _SCORER.calculate_final_score(resume_score=0.0, heuristic_score=0.0)
     
-    scorer = FinalScorer()
+    _expect(result['final_trust_score'], 0.0, "final_trust_score")
+    _expect(result['percentage'], 0.0, "percentage")
     
-    try:
-        result = scorer.calculate_final_score(
-            resume_score=56.0,
-            heuristic_score=24.0
-        )
-        
-        # Check overall percentage
-        expected_percentage = 80.0  # (56+24)/100 * 100
-        assert result['percentage'] == expected_percentage, f"Should be {expected_percentage}%, got {result['percentage']}%"
-        
-        # Check resume percentage
-        expected_resume_pct = 80.0  # 56/70 * 100
-        assert result['resume_contribution']['percentage'] == expected_resume_pct, f"Resume should be {expected_resume_pct}%"
-        
-        # Check heuristic percentage
-        expected_heuristic_pct = 80.0  # 24/30 * 100
-        assert result['heuristic_contribution']['percentage'] == expected_heuristic_pct, f"Heuristic should be {expected_heuristic_pct}%"
-        
-        return print_check(
-            6,
-            "Percentage Calculations",
-            True,
-            f"Overall: {result['percentage']}%, Resume: {result['resume_contribution']['percentage']}%, Heuristic: {result['heuristic_contribution']['percentage']}%"
-        )
-    except Exception as e:
-        return print_check(6, "Percentage Calculations", False, f"Error: {e}")
+    return f"0 + 0 = {result['final_trust_score']}/100 (0%)"
 
 
-def verify_check_7_breakdown_with_components():
-    """Check 7: Verify breakdown with component details"""
-    print("\n" + "="*80)
-    print("CHECK 7: Breakdown with Components")
-    print("="*80)
+def _check_decimal_precision():
+    result = _SCORER.calculate_final_score(resume_score=48.35, heuristic_score=19.50)
     
-    scorer = FinalScorer()
+    expected = 67.85
+    _expect(result['final_trust_score'], expected, "final_trust_score")
+    _require(isinstance(result['final_trust_score'], float), "Should be float")
     
-    try:
-        result = scorer.calculate_final_score(
-            resume_score=63.0,
-            heuristic_score=25.0,
-            resume_breakdown={'bert': 23.0, 'lstm': 40.0},
-            heuristic_breakdown={'github': 9.0, 'linkedin': 10.0, 'portfolio': 3.0, 'experience': 3.0}
-        )
-        
-        # Check resume breakdown
-        assert result['breakdown']['resume']['components']['bert'] == 23.0, "BERT should be 23.0"
-        assert result['breakdown']['resume']['components']['lstm'] == 40.0, "LSTM should be 40.0"
-        
-        # Check heuristic breakdown
-        assert result['breakdown']['heuristic']['components']['github'] == 9.0, "GitHub should be 9.0"
-        assert result['breakdown']['heuristic']['components']['linkedin'] == 10.0, "LinkedIn should be 10.0"
-        assert result['breakdown']['heuristic']['components']['portfolio'] == 3.0, "Portfolio should be 3.0"
-        assert result['breakdown']['heuristic']['components']['experience'] == 3.0, "Experience should be 3.0"
-        
-        return print_check(
-            7,
-            "Breakdown with Components",
-            True,
-            "BERT, LSTM, GitHub, LinkedIn, Portfolio, Experience all present"
-        )
-    except Exception as e:
-        return print_check(7, "Breakdown with Components", False, f"Error: {e}")
+    return f"48.35 + 19.50 = {result['final_trust_score']}"
 
 
-def verify_check_8_breakdown_without_components():
-    """Check 8: Verify breakdown without component details"""
-    print("\n" + "="*80)
-    print("CHECK 8: Breakdown without Components")
-    print("="*80)
+def _check_percentage_calculation():
+    result = _SCORER.calculate_final_score(resume_score=56.0, heuristic_score=24.0)
     
-    scorer = FinalScorer()
+    # Check overall percentage
+    expected_percentage = 80.0  # (56+24)/100 * 100
+    _expect(result['percentage'], expected_percentage, "percentage")
     
-    try:
-        result = scorer.calculate_final_score(
-            resume_score=50.0,
-            heuristic_score=20.0
-        )
-        
-        # Check that totals are present
-        assert result['breakdown']['resume']['total'] == 50.0, "Resume total should be 50.0"
-        assert result['breakdown']['heuristic']['total'] == 20.0, "Heuristic total should be 20.0"
-        
-        # Check that components are None
-        assert result['breakdown']['resume']['components']['bert'] is None, "BERT should be None"
-        assert result['breakdown']['resume']['components']['lstm'] is None, "LSTM should be None"
-        
-        return print_check(
-            8,
-            "Breakdown without Components",
-            True,
-            "Totals present, components None as expected"
-        )
-    except Exception as e:
-        return print_check(8, "Breakdown without Components", False, f"Error: {e}")
-
-
-def verify_check_9_interpretation():
-    """Check 9: Verify score interpretation"""
-    print("\n" + "="*80)
-    print("CHECK 9: Score Interpretation")
-    print("="*80)
+    # Check resume percentage
+    expected_resume_pct = 80.0  # 56/70 * 100
+    _expect(result['resume_contribution']['percentage'], expected_resume_pct, "resume_contribution.percentage")
     
-    scorer = FinalScorer()
+    # Check heuristic percentage
+    expected_heuristic_pct = 80.0  # 24/30 * 100
+    _expect(result['heuristic_contribution']['percentage'], expected_heuristic_pct, "heuristic_contribution.percentage")
     
-    try:
-        test_cases = [
-            (95.0, "Exceptional"),
-            (85.0, "Excellent"),
-            (75.0, "Good"),
-            (65.0, "Acceptable"),
-            (55.0, "Fair"),
-            (45.0, "Poor"),
-            (35.0, "Very Poor")
-        ]
-        
-        all_correct = True
-        for score, expected_keyword in test_cases:
-            interpretation = scorer.get_score_interpretation(score)
-            if expected_keyword not in interpretation:
-                all_correct = False
-                break
-        
-        assert all_correct, "All interpretations should contain expected keywords"
-        
-        return print_check(
-            9,
-            "Score Interpretation",
-            True,
-            f"Tested {len(test_cases)} score ranges, all correct"
-        )
-    except Exception as e:
-        return print_check(9, "Score Interpretation", False, f"Error: {e}")
-
-
-def verify_check_10_with_interpretation():
-    """Check 10: Verify calculate_with_interpretation method"""
-    print("\n" + "="*80)
-    print("CHECK 10: Calculate with Interpretation")
-    print("="*80)
+    return (
+        f"Overall: {result['percentage']}%, Resume: {result['resume_contribution']['percentage']}%, "
+        f"Heuristic: {result['heuristic_contribution']['percentage']}%"
+    )
+
+
+def _check_breakdown_with_components():
+    result = _SCORER.calculate_final_score(
+        resume_score=63.0,
+        heuristic_score=25.0,
+        resume_breakdown={'bert': 23.0, 'lstm': 40.0},
+        heuristic_breakdown={'github': 9.0, 'linkedin': 10.0, 'portfolio': 3.0, 'experience': 3.0}
+    )
     
-    scorer = FinalScorer()
+    # Check resume breakdown
+    _expect(result['breakdown']['resume']['components']['bert'], 23.0, "breakdown.resume.components.bert")
+    _expect(result['breakdown']['resume']['components']['lstm'], 40.0, "breakdown.resume.components.lstm")
     
-    try:
-        result = scorer.calculate_with_interpretation(
-            resume_score=60.0,
-            heuristic_score=25.0
-        )
-        
-        assert 'interpretation' in result, "Should have interpretation key"
-        assert isinstance(result['interpretation'], str), "Interpretation should be string"
-        assert len(result['interpretation']) > 0, "Interpretation should not be empty"
-        assert result['final_trust_score'] == 85.0, "Score should be 85.0"
-        
-        return print_check(
-            10,
-            "Calculate with Interpretation",
-            True,
-            f"Score: {result['final_trust_score']}, Interpretation: {result['interpretation'][:50]}..."
-        )
-    except Exception as e:
-        return print_check(10, "Calculate with Interpretation", False, f"Error: {e}")
+    # Check heuristic breakdown
+    _expect(result['breakdown']['heuristic']['components']['github'], 9.0, "breakdown.heuristic.components.github")
+    _expect(result['breakdown']['heuristic']['components']['linkedin'], 10.0, "breakdown.heuristic.components.linkedin")
+    _expect(result['breakdown']['heuristic']['components']['portfolio'], 3.0, "breakdown.heuristic.components.portfolio")
+    _expect(result['breakdown']['heuristic']['components']['experience'], 3.0, "breakdown.heuristic.components.experience")
+    
+    return "BERT, LSTM, GitHub, LinkedIn, Portfolio, Experience all present"
 
 
-def verify_check_11_validation_negative():
-    """Check 11: Verify validation rejects negative scores"""
-    print("\n" + "="*80)
-    print("CHECK 11: Validation - Negative Scores")
-    print("="*80)
+def _check_breakdown_without_components():
+    result = _SCORER.calculate_final_score(resume_score=50.0, heuristic_score=20.0)
     
-    scorer = FinalScorer()
+    # Check that totals are present
+    _expect(result['breakdown']['resume']['total'], 50.0, "breakdown.resume.total")
+    _expect(result['breakdown']['heuristic']['total'], 20.0, "breakdown.heuristic.total")
     
-    try:
-        # Should raise ValueError
-        try:
-            result = scorer.calculate_final_score(
-                resume_score=-10.0,
-                heuristic_score=25.0
-            )
-            # If we get here, validation failed
-            return print_check(11, "Validation - Negative Scores", False, "Should have raised ValueError")
-        except ValueError as e:
-            # Expected behavior
-            return print_check(
-                11,
-                "Validation - Negative Scores",
-                True,
-                f"Correctly rejected: {str(e)[:60]}..."
-            )
-    except Exception as e:
-        return print_check(11, "Validation - Negative Scores", False, f"Unexpected error: {e}")
-
-
-def verify_check_12_validation_exceeds_max():
-    """Check 12: Verify validation rejects scores exceeding maximum"""
-    print("\n" + "="*80)
-    print("CHECK 12: Validation - Exceeds Maximum")
-    print("="*80)
+    # Check that components are None
+    _require(result['breakdown']['resume']['components']['bert'] is None, "BERT should be None")
+    _require(result['breakdown']['resume']['components']['lstm'] is None, "LSTM should be None")
     
-    scorer = FinalScorer()
+    return "Totals present, components None as expected"
+
+
+def _check_interpretation():
+    test_cases = [
+        (95.0, "Exceptional"),
+        (85.0, "Excellent"),
+        (75.0, "Good"),
+        (65.0, "Acceptable"),
+        (55.0, "Fair"),
+        (45.0, "Poor"),
+        (35.0, "Very Poor")
+    ]
     
-    try:
-        # Test resume score exceeding max
-        try:
-            result = scorer.calculate_final_score(
-                resume_score=75.0,  # Max is 70
-                heuristic_score=25.0
-            )
-            return print_check(12, "Validation - Exceeds Maximum", False, "Should have raised ValueError")
-        except ValueError as e:
-            pass  # Expected
-        
-        # Test heuristic score exceeding max
-        try:
-            result = scorer.calculate_final_score(
-                resume_score=60.0,
-                heuristic_score=35.0  # Max is 30
-            )
-            return print_check(12, "Validation - Exceeds Maximum", False, "Should have raised ValueError")
-        except ValueError as e:
-            pass  # Expected
-        
-        return print_check(
-            12,
-            "Validation - Exceeds Maximum",
-            True,
-            "Correctly rejected scores exceeding maximum"
+    interpretations = _SCORER.get_score_interpretations_batch([score for score, _ in test_cases])
+    all_correct = all(
+        expected_keyword in interpretation
+        for (_, expected_keyword), interpretation in zip(test_cases, interpretations)
+    )
+    
+    _require(all_correct, "All interpretations should contain expected keywords")
+    
+    # Scalar lookup on both sides of every threshold: a score equal to a
+    # threshold belongs to the higher bucket
+    boundary_cases = [
+        (39.99, "Very Poor"), (40.0, "Poor"),
+        (49.99, "Poor"), (50.0, "Fair"),
+        (59.99, "Fair"), (60.0, "Acceptable"),
+        (69.99, "Acceptable"), (70.0, "Good"),
+        (79.99, "Good"), (80.0, "Excellent"),
+        (89.99, "Excellent"), (90.0, "Exceptional"),
+        (0.0, "Very Poor"), (100.0, "Exceptional")
+    ]
+    for score, expected_keyword in boundary_cases:
+        interpretation = _SCORER.get_score_interpretation(score)
+        _require(
+            interpretation.startswith(expected_keyword + " -"),
+            f"Score {score} should be '{expected_keyword}', got '{interpretation}'"
         )
-    except Exception as e:
-        return print_check(12, "Validation - Exceeds Maximum", False, f"Unexpected error: {e}")
+    
+    # The batch lookup must agree with the scalar one
+    boundary_scores = [score for score, _ in boundary_cases]
+    _require(
+        _SCORER.get_score_interpretations_batch(boundary_scores).tolist()
+        == [_SCORER.get_score_interpretation(score) for score in boundary_scores],
+        "Batch interpretations should match scalar interpretations"
+    )
+    
+    return f"Tested {len(test_cases)} score ranges and {len(boundary_cases)} boundaries, all correct"
 
 
-def verify_check_13_validation_non_numeric():
-    """Check 13: Verify validation rejects non-numeric inputs"""
-    print("\n" + "="*80)
-    print("CHECK 13: Validation - Non-numeric Inputs")
-    print("="*80)
+def _check_with_interpretation():
+    result = _SCORER.calculate_with_interpretation(resume_score=60.0, heuristic_score=25.0)
     
-    scorer = FinalScorer()
+    _require('interpretation' in result, "Should have interpretation key")
+    _require(isinstance(result['interpretation'], str), "Interpretation should be string")
+    _require(len(result['interpretation']) > 0, "Interpretation should not be empty")
+    _expect(result['final_trust_score'], 85.0, "final_trust_score")
     
+    return f"Score: {result['final_trust_score']}, Interpretation: {result['interpretation'][:50]}..."
+
+
+def _expect_value_error(resume_score, heuristic_score, message):
+    """Assert calculate_final_score rejects the inputs; return the error text"""
     try:
-        # Should raise ValueError
-        try:
-            result = scorer.calculate_final_score(
-                resume_score="sixty",
-                heuristic_score=25.0
-            )
-            return print_check(13, "Validation - Non-numeric Inputs", False, "Should have raised ValueError")
-        except ValueError as e:
-            return print_check(
-                13,
-                "Validation - Non-numeric Inputs",
-                True,
-                f"Correctly rejected: {str(e)[:60]}..."
-            )
-    except Exception as e:
-        return print_check(13, "Validation - Non-numeric Inputs", False, f"Unexpected error: {e}")
+        _SCORER.calculate_final_score(resume_score=resume_score, heuristic_score=heuristic_score)
+    except ValueError as e:
+        return str(e)
+    raise AssertionError(message)
+
+
+def _check_validation_negative():
+    error = _expect_value_error(-10.0, 25.0, "Should have raised ValueError")
+    return f"Correctly rejected: {error[:60]}..."
+
+
+def _check_validation_exceeds_max():
+    _expect_value_error(75.0, 25.0, "Should have raised ValueError")  # Resume max is 70
+    _expect_value_error(60.0, 35.0, "Should have raised ValueError")  # Heuristic max is 30
+    return "Correctly rejected scores exceeding maximum"
 
 
-def verify_check_14_edge_case_resume_only():
-    """Check 14: Verify edge case - only resume score"""
-    print("\n" + "="*80)
-    print("CHECK 14: Edge Case - Resume Only")
-    print("="*80)
+def _check_validation_non_numeric():
+    error = _expect_value_error("sixty", 25.0, "Should have raised ValueError")
+    return f"Correctly rejected: {error[:60]}..."
+
+
+def _check_edge_case_resume_only():
+    result = _SCORER.calculate_final_score(resume_score=70.0, heuristic_score=0.0)
     
-    scorer = FinalScorer()
+    _expect(result['final_trust_score'], 70.0, "final_trust_score")
+    _expect(result['resume_contribution']['score'], 70.0, "resume_contribution.score")
+    _expect(result['heuristic_contribution']['score'], 0.0, "heuristic_contribution.score")
     
-    try:
-        result = scorer.calculate_final_score(
-            resume_score=70.0,
-            heuristic_score=0.0
-        )
-        
-        assert result['final_trust_score'] == 70.0, f"Should be 70, got {result['final_trust_score']}"
-        assert result['resume_contribution']['score'] == 70.0, "Resume should be 70"
-        assert result['heuristic_contribution']['score'] == 0.0, "Heuristic should be 0"
-        
-        return print_check(
-            14,
-            "Edge Case - Resume Only",
-            True,
-            f"70 + 0 = {result['final_trust_score']}/100"
-        )
-    except Exception as e:
-        return print_check(14, "Edge Case - Resume Only", False, f"Error: {e}")
+    return f"70 + 0 = {result['final_trust_score']}/100"
 
 
-def verify_check_15_edge_case_heuristic_only():
-    """Check 15: Verify edge case - only heuristic score"""
-    print("\n" + "="*80)
-    print("CHECK 15: Edge Case - Heuristic Only")
-    print("="*80)
+def _check_edge_case_heuristic_only():
+    result = _SCORER.calculate_final_score(resume_score=0.0, heuristic_score=30.0)
     
-    scorer = FinalScorer()
+    _expect(result['final_trust_score'], 30.0, "final_trust_score")
+    _expect(result['resume_contribution']['score'], 0.0, "resume_contribution.score")
+    _expect(result['heuristic_contribution']['score'], 30.0, "heuristic_contribution.score")
+    
+    return f"0 + 30 = {result['final_trust_score']}/100"
+
+
+# (description, check) pairs, numbered in order. Each check raises on
+# failure and returns a detail string on success.
+CHECKS = [
+    ("FinalScorer Initialization", _check_initialization),
+    ("Singleton Pattern", _check_singleton),
+    ("Perfect Score Calculation", _check_perfect_score),
+    ("Zero Score Calculation", _check_zero_score),
+    ("Decimal Precision", _check_decimal_precision),
+    ("Percentage Calculations", _check_percentage_calculation),
+    ("Breakdown with Components", _check_breakdown_with_components),
+    ("Breakdown without Components", _check_breakdown_without_components),
+    ("Score Interpretation", _check_interpretation),
+    ("Calculate with Interpretation", _check_with_interpretation),
+    ("Validation - Negative Scores", _check_validation_negative),
+    ("Validation - Exceeds Maximum", _check_validation_exceeds_max),
+    ("Validation - Non-numeric Inputs", _check_validation_non_numeric),
+    ("Edge Case - Resume Only", _check_edge_case_resume_only),
+    ("Edge Case - Heuristic Only", _check_edge_case_heuristic_only),
+]
+
+
+def _run_check(check_num, description, check):
+    """
+    Run one check, rendering its banner and result into a private buffer
+    
+    Returns:
+        (passed, output) tuple; the caller prints output in check order
+    """
+    out = io.StringIO()
+    print("\n" + _SEP80, file=out)
+    print(f"CHECK {check_num}: {description}", file=out)
+    print(_SEP80, file=out)
     
     try:
-        result = scorer.calculate_final_score(
-            resume_score=0.0,
-            heuristic_score=30.0
-        )
-        
-        assert result['final_trust_score'] == 30.0, f"Should be 30, got {result['final_trust_score']}"
-        assert result['resume_contribution']['score'] == 0.0, "Resume should be 0"
-        assert result['heuristic_contribution']['score'] == 30.0, "Heuristic should be 30"
-        
-        return print_check(
-            15,
-            "Edge Case - Heuristic Only",
-            True,
-            f"0 + 30 = {result['final_trust_score']}/100"
-        )
+        passed = print_check(check_num, description, True, check(), file=out)
     except Exception as e:
-        return print_check(15, "Edge Case - Heuristic Only", False, f"Error: {e}")
+        passed = print_check(check_num, description, False, f"Error: {e}", file=out)
+        if _DEBUG:
+            traceback.print_exc(file=out)
+    
+    return passed, out.getvalue()
 
 
-def main():
-    """Run all verification checks"""
-    print("\n" + "🔍"*40)
+def run_verification():
+    """Run all verification checks, printing progress to stdout"""
+    print("\n" + _EYE)
     print("  STEP 5.1 VERIFICATION")
     print("  Final Trust Score Calculation")
-    print("🔍"*40)
+    print(_EYE)
     
     results = []
     
     try:
-        results.append(verify_check_1_initialization())
-        results.append(verify_check_2_singleton())
-        results.append(verify_check_3_perfect_score())
-        results.append(verify_check_4_zero_score())
-        results.append(verify_check_5_decimal_precision())
-        results.append(verify_check_6_percentage_calculation())
-        results.append(verify_check_7_breakdown_with_components())
-        results.append(verify_check_8_breakdown_without_components())
-        results.append(verify_check_9_interpretation())
-        results.append(verify_check_10_with_interpretation())
-        results.append(verify_check_11_validation_negative())
-        results.append(verify_check_12_validation_exceeds_max())
-        results.append(verify_check_13_validation_non_numeric())
-        results.append(verify_check_14_edge_case_resume_only())
-        results.append(verify_check_15_edge_case_heuristic_only())
+        # Checks are independent and share only the read-only scorer, so
+        # run them concurrently and print each one's output in table order
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            outcomes = executor.map(
+                lambda numbered: _run_check(numbered[0], *numbered[1]),
+                enumerate(CHECKS, 1)
+            )
+            for passed, output in outcomes:
+                print(output, end="")
+                results.append(passed)
         
         # Print summary
-        print("\n" + "="*80)
+        print("\n" + _SEP80)
         print("VERIFICATION SUMMARY")
-        print("="*80)
+        print(_SEP80)
         
         passed = sum(results)
         total = len(results)
@@ -546,10 +381,26 @@ def main():
         return 1
     except Exception as e:
         print(f"\n\n❌ Verification error: {e}")
-        import traceback
-        traceback.print_exc()
+        if _DEBUG:
+            traceback.print_exc()
         return 1
 
 
+def main():
+    """
+    Run all verification checks
+    
+    Output is buffered and written to stdout in one go at the end, so the
+    report is not interleaved with log lines or slowed by per-line writes.
+    """
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            return run_verification()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
 if __name__ == "__main__":
     exit(main())
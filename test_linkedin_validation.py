@@ -45,6 +45,17 @@ def test_linkedin_urls():
         print(f"   URL: {url if url else '(empty)'}")
         print(f"   Expected: {expected}, Got: {result}")
     
+    # Batch check must agree with the per-URL check
+    batch_results = validator.validate_linkedin_urls_batch([url for url, _, _ in test_urls])
+    expected_results = [expected for _, expected, _ in test_urls]
+    if batch_results.tolist() == expected_results:
+        passed += 1
+        print("\n✅ PASS: Batch validation matches per-URL results")
+    else:
+        failed += 1
+        print("\n❌ FAIL: Batch validation differs from per-URL results")
+        print(f"   Expected: {expected_results}, Got: {batch_results.tolist()}")
+    
     print("\n" + "="*70)
     print(f"Results: {passed} passed, {failed} failed")
     print("="*70)
@@ -12,14 +12,36 @@ Version: 1.0
 
 import numpy as np
 import torch
-from torch.utils.data import Dataset, DataLoader
+from torch.utils.data import DataLoader, Dataset
 from typing import Tuple, Optional
 import logging
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Gather the selected rows into the (N, 2, 768) input array: timestep 0 =
+# BERT embeddings, timestep 1 = project indicators (the rest of out stays
+# zero). Compiled with Numba when it is installed (cached to disk, so the
+# JIT cost is paid once); otherwise NumPy fancy indexing is used.
+if njit is not None:
+    @njit(cache=True)
+    def _pack_rows(embeddings, features, indices, out):
+        for i in range(indices.shape[0]):
+            row = indices[i]
+            out[i, 0, :] = embeddings[row]
+            out[i, 1, :features.shape[1]] = features[row]
+else:
+    def _pack_rows(embeddings, features, indices, out):
+        out[:, 0, :] = embeddings[indices]
+        out[:, 1, :features.shape[1]] = features[indices]
+
+
 class FreelancerDataset(Dataset):
     """
     PyTorch Dataset for LSTM training
@@ -34,7 +56,9 @@ class FreelancerDataset(Dataset):
         embeddings: np.ndarray,  # Shape: (N, 768)
         features: np.ndarray,     # Shape: (N, 6)
         labels: np.ndarray,       # Shape: (N,)
-        device: str = 'cpu'
+        device: str = 'cpu',
+        indices: Optional[np.ndarray] = None,
+        dtype: torch.dtype = torch.float32
     ):
         """
         Initialize dataset
@@ -43,7 +67,16 @@ class FreelancerDataset(Dataset):
             embeddings: BERT embeddings (N, 768)
             features: Project indicators (N, 6)
             labels: Trust labels (N,) - 1=Trustworthy, 0=Risky
-            device: 'cpu' or 'cuda'
+            device: 'cpu' or 'cuda'. Tensors always stay on the CPU (so
+                DataLoader workers can share them); for CUDA they are pinned
+                so the training loop can copy batches with non_blocking=True
+            indices: Optional row indices selecting this dataset's samples
+                from the arrays above (e.g. a train/val split); rows are
+                copied straight into the input tensor, with no intermediate
+                subset arrays
+            dtype: Storage dtype of the BERT embeddings. torch.float16
+                halves dataset memory; the project indicators are always
+                kept in float32 and batches are returned in float32
         """
         self.device = device
         
@@ -53,19 +86,41 @@ class FreelancerDataset(Dataset):
         assert embeddings.shape[1] == 768, f"Expected 768 BERT dims, got {embeddings.shape[1]}"
         assert features.shape[1] == 6, f"Expected 6 project indicators, got {features.shape[1]}"
         
-        # Convert to tensors
-        self.embeddings = torch.FloatTensor(embeddings).to(device)
-        self.features = torch.FloatTensor(features).to(device)
-        self.labels = torch.LongTensor(labels).to(device)
+        if indices is None:
+            indices = np.arange(len(labels))
+        indices = np.ascontiguousarray(indices, dtype=np.int64)
+        
+        # Build all inputs once as (N, 2, 768): timestep 0 = BERT embeddings,
+        # timestep 1 = project indicators zero-padded to 768
+        self.x = torch.zeros(len(indices), 2, 768)
+        _pack_rows(
+            np.ascontiguousarray(embeddings, dtype=np.float32),
+            np.ascontiguousarray(features, dtype=np.float32),
+            indices,
+            self.x.numpy()
+        )
+        # Reduced precision applies to the embeddings only: the project
+        # indicators (0-100 scale) are kept exactly and restored per batch
+        self.features = None
+        if dtype != torch.float32:
+            self.features = self.x[:, 1, :features.shape[1]].clone()
+            self.x = self.x.to(dtype)
+        self.labels = torch.from_numpy(np.array(labels[indices], dtype=np.int64))
+        
+        if device.startswith('cuda'):
+            self.x = self.x.pin_memory()
+            self.labels = self.labels.pin_memory()
+            if self.features is not None:
+                self.features = self.features.pin_memory()
         
-        logger.info(f"✅ FreelancerDataset initialized: {len(self)} samples on {device}")
+        logger.info(f"✅ FreelancerDataset initialized: {len(self)} samples for {device}")
     
     def __len__(self) -> int:
         return len(self.labels)
     
     def __getitem__(self, idx: int) -> Tuple[torch.Tensor, torch.Tensor]:
         """
-        Get one sample
+        Get one sample (or a batch, when idx is a list of indices)
         
         Returns:
             x: Input tensor of shape (2, features) where:
@@ -73,22 +128,24 @@ class FreelancerDataset(Dataset):
                - x[1] = Project indicators (6 dims), zero-padded to 768
             y: Label (0 or 1)
         """
-        # Get BERT embeddings (768 dims)
-        bert_embedding = self.embeddings[idx]  # (768,)
-        
-        # Get project features (6 dims)
-        project_features = self.features[idx]  # (6,)
-        
-        # Pad project features to 768 dims to match BERT
-        padded_features = torch.zeros(768, device=self.device)
-        padded_features[:6] = project_features
-        
-        # Stack as 2 timesteps: [BERT, project_indicators]
-        x = torch.stack([bert_embedding, padded_features])  # (2, 768)
-        
-        y = self.labels[idx]
-        
-        return x, y
+        x = self.x[idx]
+        if self.features is not None:
+            x = x.float()
+            x[..., 1, :self.features.shape[-1]] = self.features[idx]
+        return x, self.labels[idx]
+    
+    def __getitems__(self, indices: list) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Get a whole batch for DataLoader with a single gather from the
+        precomputed tensors (instead of one __getitem__ call per sample
+        and a torch.stack collate); pair with collate_batch
+        """
+        return self[indices]
+
+
+def collate_batch(batch: Tuple[torch.Tensor, torch.Tensor]) -> Tuple[torch.Tensor, torch.Tensor]:
+    """DataLoader collate_fn for FreelancerDataset: batches arrive already stacked"""
+    return batch
 
 
 def create_data_loaders(
@@ -99,7 +156,9 @@ def create_data_loaders(
     train_split: float = 0.8,
     shuffle: bool = True,
     device: str = 'cpu',
-    seed: int = 42
+    seed: int = 42,
+    num_workers: int = 0,
+    dtype: torch.dtype = torch.float32
 ) -> Tuple[DataLoader, DataLoader]:
     """
     Create train and validation data loaders
@@ -113,15 +172,25 @@ def create_data_loaders(
         shuffle: Whether to shuffle data
         device: 'cpu' or 'cuda'
         seed: Random seed for reproducibility
+        num_workers: DataLoader worker processes (default: 0, load in the
+            main process). Each batch is a single gather from an in-memory
+            tensor, so workers mostly add IPC overhead; under the spawn start
+            method (Windows/macOS) they also require an
+            if __name__ == '__main__' guard in the calling script
+        dtype: Storage dtype of the BERT embeddings (default float32; see
+            FreelancerDataset)
     
     Returns:
         train_loader, val_loader
-    """
-    np.random.seed(seed)
     
+    Batches are produced on the CPU; move them with
+    x.to(device, non_blocking=True) in the training loop.
+    """
     # Shuffle indices
     n_samples = len(labels)
-    indices = np.random.permutation(n_samples) if shuffle else np.arange(n_samples)
+    indices = np.arange(n_samples)
+    if shuffle:
+        np.random.default_rng(seed).shuffle(indices)
     
     # Split indices
     n_train = int(n_samples * train_split)
@@ -130,33 +199,37 @@ def create_data_loaders(
     
     # Create datasets
     train_dataset = FreelancerDataset(
-        embeddings[train_indices],
-        features[train_indices],
-        labels[train_indices],
-        device=device
+        embeddings,
+        features,
+        labels,
+        device=device,
+        indices=train_indices,
+        dtype=dtype
     )
     
     val_dataset = FreelancerDataset(
-        embeddings[val_indices],
-        features[val_indices],
-        labels[val_indices],
-        device=device
+        embeddings,
+        features,
+        labels,
+        device=device,
+        indices=val_indices,
+        dtype=dtype
     )
     
-    # Create data loaders
-    train_loader = DataLoader(
-        train_dataset,
-        batch_size=batch_size,
-        shuffle=shuffle,
-        drop_last=False
-    )
+    # Create data loaders (pinned batches let CUDA copies overlap compute).
+    # Each batch is fetched through FreelancerDataset.__getitems__ as one
+    # gather, so collate_batch has nothing left to stack.
+    loader_options = {
+        'batch_size': batch_size,
+        'drop_last': False,
+        'collate_fn': collate_batch,
+        'pin_memory': device != 'cpu',
+        'num_workers': num_workers,
+        'persistent_workers': num_workers > 0
+    }
     
-    val_loader = DataLoader(
-        val_dataset,
-        batch_size=batch_size,
-        shuffle=False,
-        drop_last=False
-    )
+    train_loader = DataLoader(train_dataset, shuffle=shuffle, **loader_options)
+    val_loader = DataLoader(val_dataset, shuffle=False, **loader_options)
     
     logger.info(f"📊 Data loaders created:")
     logger.info(f"   Train: {len(train_dataset)} samples ({len(train_loader)} batches)")
@@ -180,13 +253,14 @@ def load_dataset_from_files(
         labels_file: Path to labels .npy file
     
     Returns:
-        embeddings, features, labels as numpy arrays
+        embeddings, features, labels as read-only memory-mapped numpy arrays
+        (pages are read from disk on demand; do not write to them)
     """
     logger.info(f"Loading dataset files...")
     
-    embeddings = np.load(embeddings_file)
-    features = np.load(features_file)
-    labels = np.load(labels_file)
+    embeddings = np.load(embeddings_file, mmap_mode='r')
+    features = np.load(features_file, mmap_mode='r')
+    labels = np.load(labels_file, mmap_mode='r')
     
     logger.info(f"✅ Loaded:")
     logger.info(f"   Embeddings: {embeddings.shape}")
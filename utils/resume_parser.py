@@ -6,34 +6,129 @@ Version: 1.0
 """
 
 import re
+import hashlib
+import io
+import itertools
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import BinaryIO, Iterable, List, Optional, Union
 import PyPDF2
 import docx
 from config.config import FileProcessingConfig
 
+# Optional Rust-backed PDF extraction (pip install pdfplumber-rs). The package
+# installs as `pdfplumber`; only it ships the `_native` extension, so the
+# pure-Python pdfplumber is not picked up here.
+try:
+    import pdfplumber
+    from pdfplumber import _native  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    pdfplumber = None
+
+# Optional PDFium-backed PDF extraction (pip install pypdfium2)
+try:
+    import pypdfium2
+except ImportError:  # pragma: no cover - optional dependency
+    pypdfium2 = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# clean_text patterns, compiled once at import
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_EMAIL_RE = re.compile(r'\S+@\S+')
+# Runs of anything but alphanumerics, whitespace and basic punctuation (this
+# also covers bullet characters such as • ● ▪ ►). A whole run becomes one
+# space: clean_text collapses space runs afterwards anyway, so this matches
+# the per-character result with far fewer substitutions on "═════" rules.
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.,;:\-\(\)\[\]\{\}\'\"\/\+\#\&]+')
+
+# Same substitution as a str.translate table, for ASCII-only text (str.isascii()
+# is O(1), and translate is a single C loop with no per-character regex dispatch)
+_ASCII_SPECIAL_CHARS_TABLE = str.maketrans({
+    chr(codepoint): ' '
+    for codepoint in range(128)
+    if _SPECIAL_CHARS_RE.match(chr(codepoint))
+})
+
+_DOTS_RE = re.compile(r'\.{2,}')
+_DASHES_RE = re.compile(r'-{2,}')
+_UNDERSCORES_RE = re.compile(r'_{2,}')
+_SPACES_RE = re.compile(r'[ \t]+')
+
 
 class ResumeParser:
     """
     Parser for extracting and cleaning text from resume files (PDF and DOCX)
     """
     
-    def __init__(self):
+    __slots__ = (
+        'max_length',
+        'min_length',
+        'text_cleaning_enabled',
+        'pdf_backend',
+        '_process_cache',
+        '_process_cache_lock'
+    )
+    
+    # Number of distinct resume files whose processed text is memoized
+    PROCESS_CACHE_SIZE = 128
+    
+    # Raw text longer than this multiple of max_length is cut down before
+    # cleaning (headroom for the characters clean_text removes)
+    RAW_LENGTH_FACTOR = 2
+    
+    # PDF text extraction backends. "auto" is PyPDF2, the reference backend:
+    # the others extract slightly different text (e.g. pdfplumber-rs drops
+    # some inter-word spaces), which changes every downstream score, so they
+    # are only used when asked for by name
+    PDF_BACKENDS = ('auto', 'pypdf2', 'pdfplumber-rs', 'pypdfium2')
+    
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Initialize Resume Parser
+        
+        Args:
+            backend: PDF text extraction backend, one of PDF_BACKENDS
+                (default: FileProcessingConfig.PDF_BACKEND)
+            
+        Raises:
+            ValueError: If the backend is unknown
+            ImportError: If the backend's package is not installed
+        """
         self.max_length = FileProcessingConfig.MAX_RESUME_LENGTH
         self.min_length = FileProcessingConfig.MIN_RESUME_LENGTH
         self.text_cleaning_enabled = FileProcessingConfig.TEXT_CLEANING_ENABLED
+        
+        backend = (backend or FileProcessingConfig.PDF_BACKEND).lower()
+        if backend not in self.PDF_BACKENDS:
+            raise ValueError(f"Unknown PDF backend: {backend}. Supported backends: {', '.join(self.PDF_BACKENDS)}")
+        if backend == 'auto':
+            backend = 'pypdf2'
+        elif backend == 'pdfplumber-rs' and pdfplumber is None:
+            raise ImportError("The pdfplumber-rs backend requires pdfplumber-rs (pip install pdfplumber-rs)")
+        elif backend == 'pypdfium2' and pypdfium2 is None:
+            raise ImportError("The pypdfium2 backend requires pypdfium2 (pip install pypdfium2)")
+        self.pdf_backend = backend
+        
+        # LRU memo of process_resume keyed on (file extension, SHA-256 of contents)
+        self._process_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        # One parser may be shared across threads (API, convenience functions)
+        self._process_cache_lock = threading.Lock()
     
-    def extract_text(self, file_path: Union[str, Path]) -> str:
+    def extract_text(self, file_path: Union[str, Path], data: Optional[bytes] = None) -> str:
         """
         Extract raw text from resume file (PDF or DOCX)
         
         Args:
             file_path: Path to the resume file
+            data: File contents, if already read (parsed from memory instead
+                of reading the file again)
             
         Returns:
             Extracted raw text as string
@@ -44,16 +139,17 @@ class ResumeParser:
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
+        if data is None and not file_path.exists():
             raise FileNotFoundError(f"Resume file not found: {file_path}")
         
         file_extension = file_path.suffix.lower()
+        source = file_path if data is None else io.BytesIO(data)
         
         try:
             if file_extension == '.pdf':
-                raw_text = self._extract_from_pdf(file_path)
+                raw_text = self._extract_from_pdf(source)
             elif file_extension in ['.docx', '.doc']:
-                raw_text = self._extract_from_docx(file_path)
+                raw_text = self._extract_from_docx(source)
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}. Supported formats: .pdf, .docx, .doc")
             
@@ -64,63 +160,99 @@ class ResumeParser:
             logger.error(f"Error extracting text from {file_path}: {str(e)}")
             raise
     
-    def _extract_from_pdf(self, file_path: Path) -> str:
+    def _extract_from_pdf(self, source: Union[Path, BinaryIO]) -> str:
         """
         Extract text from PDF file
         
         Args:
-            file_path: Path to PDF file
+            source: Path to PDF file, or a binary stream of its contents
             
         Returns:
             Extracted text
         """
-        text = []
+        if self.pdf_backend == 'pdfplumber-rs':
+            return self._extract_from_pdf_rust(source)
+        if self.pdf_backend == 'pypdfium2':
+            return self._extract_from_pdf_pdfium(source)
         
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                num_pages = len(pdf_reader.pages)
-                
-                for page_num in range(num_pages):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
-                    if page_text:
-                        text.append(page_text)
-                
-            return '\n'.join(text)
+            pdf_reader = PyPDF2.PdfReader(source)
+            
+            # Iterate pages directly and skip pages with no text
+            page_texts = (page.extract_text() for page in pdf_reader.pages)
+            return '\n'.join(page_text for page_text in page_texts if page_text)
             
         except Exception as e:
             logger.error(f"PDF extraction error: {str(e)}")
             raise ValueError(f"Failed to extract text from PDF: {str(e)}")
     
-    def _extract_from_docx(self, file_path: Path) -> str:
+    def _extract_from_pdf_rust(self, source: Union[Path, BinaryIO]) -> str:
         """
-        Extract text from DOCX file
+        Extract text from PDF file with the Rust pdfplumber-rs backend
         
         Args:
-            file_path: Path to DOCX file
+            source: Path to PDF file, or a binary stream of its contents
             
         Returns:
             Extracted text
         """
-        text = []
+        try:
+            with pdfplumber.open(str(source) if isinstance(source, Path) else source) as pdf:
+                page_texts = (page.extract_text() for page in pdf.pages)
+                return '\n'.join(page_text for page_text in page_texts if page_text)
+            
+        except Exception as e:
+            logger.error(f"PDF extraction error: {str(e)}")
+            raise ValueError(f"Failed to extract text from PDF: {str(e)}")
+    
+    def _extract_from_pdf_pdfium(self, source: Union[Path, BinaryIO]) -> str:
+        """
+        Extract text from PDF file with the PDFium (pypdfium2) backend
         
+        Args:
+            source: Path to PDF file, or a binary stream of its contents
+            
+        Returns:
+            Extracted text
+        """
         try:
-            doc = docx.Document(file_path)
+            pdf = pypdfium2.PdfDocument(str(source) if isinstance(source, Path) else source)
+            try:
+                # PDFium ends lines with \r\n; normalize to \n like the other backends
+                page_texts = (page.get_textpage().get_text_range().replace('\r\n', '\n') for page in pdf)
+                return '\n'.join(page_text for page_text in page_texts if page_text)
+            finally:
+                pdf.close()
             
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text.append(paragraph.text)
+        except Exception as e:
+            logger.error(f"PDF extraction error: {str(e)}")
+            raise ValueError(f"Failed to extract text from PDF: {str(e)}")
+    
+    def _extract_from_docx(self, source: Union[Path, BinaryIO]) -> str:
+        """
+        Extract text from DOCX file
+        
+        Args:
+            source: Path to DOCX file, or a binary stream of its contents
             
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text.append(cell.text)
+        Returns:
+            Extracted text
+        """
+        try:
+            doc = docx.Document(source)
             
-            return '\n'.join(text)
+            # Paragraphs then table cells, reading each .text only once
+            paragraph_texts = (paragraph.text for paragraph in doc.paragraphs)
+            cell_texts = (
+                cell.text
+                for table in doc.tables
+                for row in table.rows
+                for cell in row.cells
+            )
+            return '\n'.join(
+                text for text in itertools.chain(paragraph_texts, cell_texts)
+                if text and not text.isspace()
+            )
             
         except Exception as e:
             logger.error(f"DOCX extraction error: {str(e)}")
@@ -141,47 +273,40 @@ class ResumeParser:
         
         text = raw_text
         
+        # Each pass below is skipped when its trigger substring is absent
+        # (an `in` check is a plain C substring search, much cheaper than a
+        # regex scan that finds nothing)
+        
         # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+        if '://' in text:
+            text = _URL_RE.sub('', text)
         
         # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        
-        # Remove special characters but preserve alphanumeric, spaces, and basic punctuation
-        text = re.sub(r'[^\w\s\.,;:\-\(\)\[\]\{\}\'\"\/\+\#\&]', ' ', text)
+        if '@' in text:
+            text = _EMAIL_RE.sub('', text)
         
-        # Remove extra bullet points and formatting characters
-        text = re.sub(r'[•●○▪▫■□★☆▸▹►▻]', '', text)
+        # Remove special characters and bullets but preserve alphanumeric, spaces, and basic punctuation
+        if text.isascii():
+            text = text.translate(_ASCII_SPECIAL_CHARS_TABLE)
+        else:
+            text = _SPECIAL_CHARS_RE.sub(' ', text)
         
         # Remove multiple consecutive dots (like .........)
-        text = re.sub(r'\.{2,}', '.', text)
-        
-        # Remove multiple consecutive dashes or underscores
-        text = re.sub(r'-{2,}', '-', text)
-        text = re.sub(r'_{2,}', '_', text)
-        
-        # Remove form field remnants (like ________)
-        text = re.sub(r'_{3,}', '', text)
-        
-        # Replace multiple SPACES with single space (but preserve newlines!)
-        # Split by lines to preserve line structure
-        lines = text.split('\n')
-        lines = [re.sub(r'[ \t]+', ' ', line) for line in lines]  # Only collapse spaces/tabs, not newlines
-        text = '\n'.join(lines)
-        
-        # Replace multiple newlines with double newline (preserve some spacing between sections)
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-        
-        # Remove leading/trailing whitespace from each line
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
-        
-        # Remove empty lines
-        lines = [line for line in text.split('\n') if line.strip()]
-        text = '\n'.join(lines)
-        
-        # Final trim
-        text = text.strip()
+        if '..' in text:
+            text = _DOTS_RE.sub('.', text)
+        
+        # Collapse runs of dashes or underscores (this also shortens form field
+        # remnants like ________ to a single underscore)
+        if '--' in text:
+            text = _DASHES_RE.sub('-', text)
+        if '__' in text:
+            text = _UNDERSCORES_RE.sub('_', text)
+        
+        # Collapse spaces/tabs (but preserve newlines) in one regex call over
+        # the whole text, then strip each line and drop empty lines (map and
+        # filter keep the per-line work in C; join sizes its output once)
+        text = _SPACES_RE.sub(' ', text)
+        text = '\n'.join(filter(None, map(str.strip, text.split('\n'))))
         
         logger.info(f"Text cleaned: {len(raw_text)} -> {len(text)} characters")
         return text
@@ -190,6 +315,10 @@ class ResumeParser:
         """
         Complete pipeline: Extract and clean text from resume
         
+        Results are memoized by file content (SHA-256), so re-uploading the
+        same resume skips extraction and cleaning. Use clear_cache() to force
+        a fresh parse.
+        
         Args:
             file_path: Path to resume file
             
@@ -199,8 +328,50 @@ class ResumeParser:
         Raises:
             ValueError: If text is too short or too long
         """
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            raise FileNotFoundError(f"Resume file not found: {file_path}")
+        
+        # Read the file once: the bytes are both hashed and parsed
+        data = file_path.read_bytes()
+        key = (file_path.suffix.lower(), hashlib.sha256(data).digest())
+        
+        with self._process_cache_lock:
+            clean_text = self._process_cache.get(key)
+            if clean_text is not None:
+                self._process_cache.move_to_end(key)
+        if clean_text is not None:
+            logger.info(f"Resume served from cache: {file_path.name}")
+            return clean_text
+        
+        clean_text = self._process_resume_uncached(file_path, data)
+        
+        with self._process_cache_lock:
+            self._process_cache[key] = clean_text
+            if len(self._process_cache) > self.PROCESS_CACHE_SIZE:
+                self._process_cache.popitem(last=False)
+        
+        return clean_text
+    
+    def clear_cache(self) -> None:
+        """Clear memoized process_resume results"""
+        with self._process_cache_lock:
+            self._process_cache.clear()
+    
+    def _process_resume_uncached(self, file_path: Path, data: Optional[bytes] = None) -> str:
+        """Extract, clean and validate resume text (process_resume body)"""
         # Extract raw text
-        raw_text = self.extract_text(file_path)
+        raw_text = self.extract_text(file_path, data)
+        
+        # Don't clean text that would be truncated away anyway
+        raw_limit = self.RAW_LENGTH_FACTOR * self.max_length
+        if len(raw_text) > raw_limit:
+            logger.warning(
+                f"Raw resume text far exceeds maximum length ({len(raw_text)} chars). "
+                f"Pre-truncating to {raw_limit} chars before cleaning"
+            )
+            raw_text = raw_text[:raw_limit]
         
         # Clean text
         clean_text = self.clean_text(raw_text)
@@ -225,6 +396,23 @@ class ResumeParser:
         return clean_text
 
 
+# Shared parser behind the convenience functions (also shares its
+# process_resume cache across calls). Created on first use, so a bad
+# PDF_BACKEND setting is reported by the first call, not at import.
+_default_parser_instance = None
+_default_parser_lock = threading.Lock()
+
+
+def _default_parser() -> ResumeParser:
+    """Get the shared ResumeParser, creating it on first use"""
+    global _default_parser_instance
+    if _default_parser_instance is None:
+        with _default_parser_lock:
+            if _default_parser_instance is None:
+                _default_parser_instance = ResumeParser()
+    return _default_parser_instance
+
+
 # Convenience functions for direct use
 def extract_text_from_resume(file_path: Union[str, Path]) -> str:
     """
@@ -236,8 +424,7 @@ def extract_text_from_resume(file_path: Union[str, Path]) -> str:
     Returns:
         Raw extracted text
     """
-    parser = ResumeParser()
-    return parser.extract_text(file_path)
+    return _default_parser().extract_text(file_path)
 
 
 def clean_text(raw_text: str) -> str:
@@ -250,8 +437,7 @@ def clean_text(raw_text: str) -> str:
     Returns:
         Cleaned text
     """
-    parser = ResumeParser()
-    return parser.clean_text(raw_text)
+    return _default_parser().clean_text(raw_text)
 
 
 def process_resume(file_path: Union[str, Path]) -> str:
@@ -264,8 +450,26 @@ def process_resume(file_path: Union[str, Path]) -> str:
     Returns:
         Processed, clean text ready for analysis
     """
-    parser = ResumeParser()
-    return parser.process_resume(file_path)
+    return _default_parser().process_resume(file_path)
+
+
+def process_resumes(file_paths: Iterable[Union[str, Path]], workers: Optional[int] = None) -> List[str]:
+    """
+    Process many resumes in parallel, one worker process per CPU core
+    
+    Each resume is parsed independently, so the CPU-bound PDF/DOCX work
+    scales across cores (threads would serialize on the GIL). An error
+    for any file is re-raised here, as with process_resume.
+    
+    Args:
+        file_paths: Paths to resume files
+        workers: Number of worker processes (default: os.cpu_count())
+        
+    Returns:
+        Processed texts, in the same order as file_paths
+    """
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return list(executor.map(process_resume, file_paths, chunksize=4))
 
 
 # Example usage and testing
@@ -0,0 +1,49 @@
+"""
+Tests for the LSTM data loaders
+Batches must match what the per-sample dataset returns
+"""
+
+import numpy as np
+import torch
+
+from utils.lstm_data_loader import FreelancerDataset, create_data_loaders
+
+
+def _sample_arrays(n_samples=70):
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((n_samples, 768)).astype(np.float32)
+    features = rng.uniform(0, 100, (n_samples, 6)).astype(np.float32)
+    labels = rng.integers(0, 2, n_samples)
+    return embeddings, features, labels
+
+
+def test_loader_batches_match_dataset_items():
+    """Loaders keep batch_size and yield the same samples as dataset[i]"""
+    embeddings, features, labels = _sample_arrays()
+    train_loader, val_loader = create_data_loaders(
+        embeddings, features, labels, batch_size=16, shuffle=False
+    )
+    
+    for loader in (train_loader, val_loader):
+        dataset = loader.dataset
+        assert loader.batch_size == 16
+        batches = list(loader)
+        assert len(batches) == len(loader) == -(-len(dataset) // 16)
+        
+        batch_x = torch.cat([x for x, _ in batches])
+        batch_y = torch.cat([y for _, y in batches])
+        assert batch_x.shape == (len(dataset), 2, 768)
+        assert torch.equal(batch_x, torch.stack([dataset[i][0] for i in range(len(dataset))]))
+        assert torch.equal(batch_y, torch.stack([dataset[i][1] for i in range(len(dataset))]))
+
+
+def test_shuffled_loader_covers_every_sample():
+    """A shuffled train loader still yields each sample exactly once"""
+    embeddings, features, labels = _sample_arrays()
+    dataset = FreelancerDataset(embeddings, features, labels)
+    train_loader, _ = create_data_loaders(
+        embeddings, features, labels, batch_size=16, train_split=1.0
+    )
+    
+    rows = torch.cat([x[:, 0, 0] for x, _ in train_loader])
+    assert torch.equal(rows.sort().values, dataset.x[:, 0, 0].sort().values)